@@ -0,0 +1,71 @@
+import numpy as np
+from binomial import Binomial_Pricing
+from trinomial import Trinomial_Pricing
+
+LATTICES = {
+    'binomial': Binomial_Pricing,
+    'trinomial': Trinomial_Pricing,
+}
+
+# Picks the lattice step count from a target price tolerance instead of a hand-chosen number of steps
+# Step counts double from start_steps. Each level averages the n and n + 1 step prices to cancel the odd/even
+# oscillation, and Richardson extrapolation (error ~ 1/n) is applied to consecutive levels. The strike's position
+# between nodes still makes convergence uneven, so a sequence's error is estimated conservatively from its last two
+# changes, and the search stops at the first level where either estimate is within tol
+class Adaptive_Lattice_Pricing:
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, model='binomial', tol=0.01, american=False, start_steps=25, max_steps=2000, backend=None):
+        if model not in LATTICES:
+            raise ValueError(f"Unknown model '{model}' (expected one of {list(LATTICES)}).")
+
+        self.model = model
+        self.tol = tol
+        self.american = american
+        self.start_steps = start_steps
+        self.max_steps = max_steps
+        self.args = (spot_price, strike_price, days_to_maturity, risk_free_rate, sigma)
+        self.backend = backend
+
+        self.steps = None
+        self.call_price = None
+        self.put_price = None
+        self.call_error = None
+        self.put_error = None
+        self.converged = False
+        self.history = []
+
+        self.search()
+
+    def averaged_prices(self, steps):
+        # Only the prices are read, so the lattices roll back through one level buffer instead of dense matrices
+        lattice = LATTICES[self.model]
+        low = lattice(*self.args, steps, american=self.american, backend=self.backend, compact=True)
+        high = lattice(*self.args, steps + 1, american=self.american, backend=self.backend, compact=True)
+        return np.array([(low.call_price + high.call_price) / 2, (low.put_price + high.put_price) / 2])
+
+    @staticmethod
+    def estimate_error(sequence):
+        # The latest change, or half the change before it (the error at least halves per doubling), whichever is larger
+        if len(sequence) < 3:
+            return np.full(2, np.inf)
+        return np.maximum(np.abs(sequence[-1] - sequence[-2]), np.abs(sequence[-2] - sequence[-3]) / 2)
+
+    def search(self):
+        steps = self.start_steps
+        averaged = [self.averaged_prices(steps)]
+        extrapolated = []
+        self.history.append((steps, averaged[-1], np.full(2, np.inf)))
+
+        while steps * 2 <= self.max_steps:
+            steps *= 2
+            averaged.append(self.averaged_prices(steps))
+            extrapolated.append((2 * averaged[-1]) - averaged[-2])
+
+            candidates = [(averaged[-1], self.estimate_error(averaged)), (extrapolated[-1], self.estimate_error(extrapolated))]
+            prices, errors = min(candidates, key=lambda candidate: np.max(candidate[1]))
+            self.history.append((steps, prices, errors))
+
+            if np.max(errors) <= self.tol:
+                self.converged = True
+                break
+
+        self.steps, (self.call_price, self.put_price), (self.call_error, self.put_error) = self.history[-1]
@@ -1,13 +1,22 @@
 import numpy as np
 from opt_pricing import Option_Pricing
+from kernels import get_kernel, as_ndarray
+from lattice import Binomial_Lattice, Packed_Lattice, binomial_widths
 
 class Binomial_Pricing(Option_Pricing):
-    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, steps):
-        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a')
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, steps, dtype=np.float64, memmap_dir=None, american=False, backend=None, compact=False, keep_values=False):
+        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a', dtype, memmap_dir)
         self.steps = steps
+        self.american = american
+        self.backend = backend
+        self.compact = compact
+        self.keep_values = keep_values
         self.ST = None
+        self.lattice = None
         self.call_price = None
         self.put_price = None
+        self.call_boundary = None
+        self.put_boundary = None
 
         self.generate()
 
@@ -20,30 +29,46 @@ class Binomial_Pricing(Option_Pricing):
         d = 1 / u
         q = (np.exp((self.r) * dt) - d) / (u - d)
 
-        # Initialize asset prices at maturity
-        self.ST = np.zeros((self.steps + 1, self.steps + 1))
-        self.ST[0, 0] = self.S
+        # Node spots on demand, plus the dense ST matrix unless compact is set
+        self.lattice = Binomial_Lattice(self.S, u, d, self.steps)
 
-        for i in range(1, self.steps + 1):
-            self.ST[i, 0] = self.ST[i - 1, 0] * u
-            for j in range(1, i + 1):
-                self.ST[i, j] = self.ST[i - 1, j - 1] * d
+        # Early-exercise boundary per step (American only), NaN where exercise is never optimal
+        self.call_boundary = np.full(self.steps + 1, np.nan)
+        self.put_boundary = np.full(self.steps + 1, np.nan)
 
-        # Initialize option values at maturity
-        self.call_option_values = np.zeros((self.steps + 1, self.steps + 1))
-        self.put_option_values = np.zeros((self.steps + 1, self.steps + 1))
+        if self.compact:
+            # No stored spots, and the values roll back through one level buffer per contract type (O(steps) memory),
+            # unless keep_values asks for every level in packed layout
+            if self.keep_values:
+                widths = binomial_widths(self.steps)
+                self.call_option_values = Packed_Lattice(self.allocate('call_option_values', widths.sum()), widths)
+                self.put_option_values = Packed_Lattice(self.allocate('put_option_values', widths.sum()), widths)
+                call_values, put_values, offsets = self.call_option_values.values, self.put_option_values.values, self.call_option_values.offsets
+            else:
+                call_values = self.call_option_values = self.allocate('call_option_values', self.steps + 1)
+                put_values = self.put_option_values = self.allocate('put_option_values', self.steps + 1)
+                offsets = np.zeros(self.steps + 1, dtype=np.int64)
 
-        self.call_option_values[-1, :] = np.maximum(0, self.ST[-1, :] - self.K)
-        self.put_option_values[-1, :] = np.maximum(0, self.K - self.ST[-1, :])
+            lattice = get_kernel('binomial_packed', self.backend)
+            lattice(as_ndarray(call_values), as_ndarray(put_values), offsets, float(self.S), float(self.K), u, d, q, np.exp(-self.r * dt), self.american, self.call_boundary, self.put_boundary)
+            return
 
-        # Step back through the tree
-        for i in range(self.steps - 1, -1, -1):
-            for j in range(i + 1):
-                self.call_option_values[i, j] = np.exp(-self.r * dt) * (q * self.call_option_values[i + 1, j] + (1 - q) * self.call_option_values[i + 1, j + 1])
-                self.put_option_values[i, j] = np.exp(-self.r * dt) * (q * self.put_option_values[i + 1, j] + (1 - q) * self.put_option_values[i + 1, j + 1])
+        self.ST = self.allocate('ST', (self.steps + 1, self.steps + 1))
+        self.call_option_values = self.allocate('call_option_values', (self.steps + 1, self.steps + 1))
+        self.put_option_values = self.allocate('put_option_values', (self.steps + 1, self.steps + 1))
+
+        # Build the tree and step back through it with the Numba kernel when available, NumPy otherwise
+        lattice = get_kernel('binomial_lattice', self.backend)
+        lattice(as_ndarray(self.ST), as_ndarray(self.call_option_values), as_ndarray(self.put_option_values), float(self.S), float(self.K), u, d, q, np.exp(-self.r * dt), self.american, self.call_boundary, self.put_boundary)
 
     def calc_call_price(self):
-        self.call_price = self.call_option_values[0, 0]
+        if not self.compact:
+            self.call_price = self.call_option_values[0, 0]
+        else:
+            self.call_price = self.call_option_values.node(0, 0) if self.keep_values else self.call_option_values[0]
 
     def calc_put_price(self):
-        self.put_price = self.put_option_values[0, 0]
\ No newline at end of file
+        if not self.compact:
+            self.put_price = self.put_option_values[0, 0]
+        else:
+            self.put_price = self.put_option_values.node(0, 0) if self.keep_values else self.put_option_values[0]
@@ -1,7 +1,11 @@
+import math
 import numpy as np
 from scipy.stats import norm
 from opt_pricing import Option_Pricing
 
+SQRT_2 = math.sqrt(2)
+SQRT_2PI = math.sqrt(2 * math.pi)
+
 # Implementation of Black Scholes model for European Options pricing 
 class Black_Scholes_Pricing(Option_Pricing):
     def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, dividends, sigma, contract_type):
@@ -12,10 +16,10 @@ class Black_Scholes_Pricing(Option_Pricing):
 
         if(self.contract_type == 'call'):
             self.calc_call_price()
-            self.payoff = max(self.S - self.K, 0)
+            self.payoff = np.maximum(self.S - self.K, 0)
         elif(self.contract_type == 'put'):
             self.calc_put_price()
-            self.payoff = max(self.K - self.S, 0)
+            self.payoff = np.maximum(self.K - self.S, 0)
 
     def calc_call_price(self):
         self.d1 = (np.log(self.S / self.K) + ((self.r - self.q + (0.5 * (self.sigma ** 2))) * self.T)) / (self.sigma * (self.T ** 0.5))
@@ -24,31 +28,31 @@ class Black_Scholes_Pricing(Option_Pricing):
         self.price = (self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1)) - (self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2))
 
     def calc_put_price(self):
-        self.d1 = (np.log(self.S / self.K) + ((self.r - self.q + (0.5 * (self.sigma ** 2) * self.T)))) / (self.sigma * (self.T ** 0.5))
-        self.d2 = (np.log(self.S / self.K) + ((self.r - self.q - (0.5 * (self.sigma ** 2) * self.T)))) / (self.sigma * (self.T ** 0.5))
+        self.d1 = (np.log(self.S / self.K) + ((self.r - self.q + (0.5 * (self.sigma ** 2))) * self.T)) / (self.sigma * (self.T ** 0.5))
+        self.d2 = (np.log(self.S / self.K) + ((self.r - self.q - (0.5 * (self.sigma ** 2))) * self.T)) / (self.sigma * (self.T ** 0.5))
 
         self.price = (self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2)) - (self.S * np.exp(-self.q * self.T) * norm.cdf(-self.d1))
 
     def calc_delta(self):
         if(self.contract_type == 'call'):
-            self.delta = norm.cdf(self.d1)
+            self.delta = np.exp(-self.q * self.T) * norm.cdf(self.d1)
         elif(self.contract_type == 'put'):
-            self.delta = norm.cdf(self.d1) - 1
+            self.delta = np.exp(-self.q * self.T) * (norm.cdf(self.d1) - 1)
         return self.delta
 
     def calc_gamma(self):
-        self.gamma = norm.pdf(self.d1) / (self.S * self.sigma * (self.T ** 0.5))
+        self.gamma = np.exp(-self.q * self.T) * norm.pdf(self.d1) / (self.S * self.sigma * (self.T ** 0.5))
         return self.gamma
 
     def calc_theta(self):
         if(self.contract_type == 'call'):
-            self.theta = ((-self.S * self.sigma * norm.pdf(self.d1)) / (2 * (self.T ** 0.5))) - (self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2))
+            self.theta = ((-self.S * np.exp(-self.q * self.T) * self.sigma * norm.pdf(self.d1)) / (2 * (self.T ** 0.5))) - (self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2)) + (self.q * self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1))
         elif(self.contract_type == 'put'):
-            self.theta = ((-self.S * self.sigma * norm.pdf(self.d1)) / (2 * (self.T ** 0.5))) + (self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2))
+            self.theta = ((-self.S * np.exp(-self.q * self.T) * self.sigma * norm.pdf(self.d1)) / (2 * (self.T ** 0.5))) + (self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2)) - (self.q * self.S * np.exp(-self.q * self.T) * norm.cdf(-self.d1))
         return self.theta
 
     def calc_vega(self):
-        self.vega = self.S * (self.T ** 0.5) * norm.pdf(self.d1)
+        self.vega = self.S * np.exp(-self.q * self.T) * (self.T ** 0.5) * norm.pdf(self.d1)
         return self.vega
 
     def calc_rho(self):
@@ -74,4 +78,35 @@ class Black_Scholes_Pricing(Option_Pricing):
             elif(self.contract_type == 'put'):
                 heatmap[i] = (self.K * np.exp(-self.r * self.T) * norm.cdf(-tmp_d2)) - (heat_spots * np.exp(-self.q * self.T) * norm.cdf(-tmp_d1))
 
-        return heatmap, heat_spots, heat_vols
\ No newline at end of file
+        return heatmap, heat_spots, heat_vols
+
+# Low-latency scalar path for quoting one contract at a time: plain floats, math functions and erfc-based CDFs,
+# no object construction. Returns (price, delta, gamma, theta, vega, rho) with the same conventions as the class
+def black_scholes_fast(spot_price, strike_price, days_to_maturity, risk_free_rate, dividends, sigma, contract_type):
+    T = days_to_maturity / 365
+    sqrt_T = math.sqrt(T)
+    sigma_sqrt_T = sigma * sqrt_T
+
+    d1 = (math.log(spot_price / strike_price) + ((risk_free_rate - dividends + (0.5 * sigma * sigma)) * T)) / sigma_sqrt_T
+    d2 = d1 - sigma_sqrt_T
+
+    spot_disc = spot_price * math.exp(-dividends * T)
+    strike_disc = strike_price * math.exp(-risk_free_rate * T)
+    pdf_d1 = math.exp(-0.5 * d1 * d1) / SQRT_2PI
+
+    gamma = math.exp(-dividends * T) * pdf_d1 / (spot_price * sigma_sqrt_T)
+    vega = spot_disc * sqrt_T * pdf_d1
+    theta_decay = -(spot_disc * sigma * pdf_d1) / (2 * sqrt_T)
+
+    if contract_type == 'call':
+        cdf_d1 = 0.5 * math.erfc(-d1 / SQRT_2)
+        cdf_d2 = 0.5 * math.erfc(-d2 / SQRT_2)
+        price = (spot_disc * cdf_d1) - (strike_disc * cdf_d2)
+        return price, math.exp(-dividends * T) * cdf_d1, gamma, theta_decay - (risk_free_rate * strike_disc * cdf_d2) + (dividends * spot_disc * cdf_d1), vega, strike_price * T * math.exp(-risk_free_rate * T) * cdf_d2
+    elif contract_type == 'put':
+        cdf_neg_d1 = 0.5 * math.erfc(d1 / SQRT_2)
+        cdf_neg_d2 = 0.5 * math.erfc(d2 / SQRT_2)
+        price = (strike_disc * cdf_neg_d2) - (spot_disc * cdf_neg_d1)
+        return price, -math.exp(-dividends * T) * cdf_neg_d1, gamma, theta_decay + (risk_free_rate * strike_disc * cdf_neg_d2) - (dividends * spot_disc * cdf_neg_d1), vega, -strike_price * T * math.exp(-risk_free_rate * T) * cdf_neg_d2
+
+    raise ValueError(f"Invalid option contract type '{contract_type}' (expected 'call' or 'put').")
@@ -0,0 +1,31 @@
+import time
+
+from black_scholes import Black_Scholes_Pricing
+from monte_carlo import Monte_Carlo_Pricing
+from binomial import Binomial_Pricing
+from trinomial import Trinomial_Pricing
+
+MODELS = ["Black-Scholes", "Monte-Carlo", "Binomial", "Trinomial"]
+
+# Prices one model for the comparison view, kept at module level so it can run in a worker process
+# Returns (model, call price, put price, compute time in seconds)
+def run_model(model, spot_price, strike_price, days_to_maturity, risk_free_rate, volatility, iterations, steps):
+    start = time.perf_counter()
+
+    if model == "Black-Scholes":
+        call_price = Black_Scholes_Pricing(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, volatility, "call").price
+        put_price = Black_Scholes_Pricing(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, volatility, "put").price
+    elif model == "Monte-Carlo":
+        # Only terminal prices are needed here, so paths are streamed instead of kept in full
+        option = Monte_Carlo_Pricing(spot_price, strike_price, days_to_maturity, risk_free_rate, volatility, iterations, full_path=False, chunk_size=10000)
+        call_price, put_price = option.call_price, option.put_price
+    elif model == "Binomial":
+        option = Binomial_Pricing(spot_price, strike_price, days_to_maturity, risk_free_rate, volatility, steps)
+        call_price, put_price = option.call_price, option.put_price
+    elif model == "Trinomial":
+        option = Trinomial_Pricing(spot_price, strike_price, days_to_maturity, risk_free_rate, volatility, steps)
+        call_price, put_price = option.call_price, option.put_price
+    else:
+        raise ValueError(f"Unknown model '{model}' (expected one of {MODELS}).")
+
+    return model, float(call_price), float(put_price), time.perf_counter() - start
@@ -0,0 +1,197 @@
+import numpy as np
+from scipy.linalg.blas import dger
+
+# Covariance engines over many tickers that backfill from a (bars, tickers) history and then update in O(n^2) per new
+# bar of returns. Bars must be aligned across tickers (no NaN); each engine returns plain arrays in ticker order.
+# Besides the covariance, each keeps the moments the Ledoit-Wolf shrinkage intensity needs, and caches its
+# correlation and Cholesky factor until the next update. Rank-one updates go through BLAS dger in place on
+# Fortran-ordered matrices, so a bar does not allocate an (n, n) outer product
+
+# Ledoit-Wolf shrinkage towards mu * I (sklearn.covariance.ledoit_wolf), from a weighted second-moment matrix,
+# the weighted mean of ||x_t||^4 over the same (centred) observations and the sum of squared observation weights
+def ledoit_wolf_shrinkage(cov, fourth_moment, sum_sq_weights):
+    n = len(cov)
+    mu = np.trace(cov) / n
+    delta = (np.sum(cov ** 2) - (2 * mu * np.trace(cov)) + (n * mu ** 2)) / n
+    beta = min(sum_sq_weights * (fourth_moment - np.sum(cov ** 2)) / n, delta)
+    shrinkage = 0 if beta <= 0 else beta / delta
+    return shrinkage, mu
+
+def correlation_from_covariance(cov):
+    std = np.sqrt(np.diag(cov))
+    corr = cov / np.outer(std, std)
+    np.fill_diagonal(corr, 1)
+    return corr
+
+# Lower Cholesky factor, adding a growing ridge to the diagonal when the matrix is singular (e.g. fewer bars than
+# tickers) or loses positive-definiteness to rounding. Returns the factor and the jitter that was added
+def cholesky_factor(cov, jitter=1e-10, max_tries=10):
+    try:
+        return np.linalg.cholesky(cov), 0
+    except np.linalg.LinAlgError:
+        pass
+
+    scale = np.mean(np.diag(cov))
+    for _ in range(max_tries):
+        try:
+            return np.linalg.cholesky(cov + (jitter * scale * np.eye(len(cov)))), jitter * scale
+        except np.linalg.LinAlgError:
+            jitter *= 10
+    raise np.linalg.LinAlgError(f"Covariance is not positive definite even with jitter {jitter / 10:.1e} x mean variance.")
+
+class Covariance_Engine:
+    def __init__(self, shrinkage=None):
+        # shrinkage: None, 'ledoit_wolf' for the estimated intensity, or a fixed intensity in [0, 1]
+        self.shrinkage = shrinkage
+        self.n_obs = 0
+        self.cache = {}
+
+    def calc_shrinkage(self):
+        cov, fourth_moment, sum_sq_weights = self.calc_moments()
+        return ledoit_wolf_shrinkage(cov, fourth_moment, sum_sq_weights)[0]
+
+    def calc_covariance(self):
+        if 'covariance' not in self.cache:
+            # The intensity is estimated from the moments but applied to the engine's own covariance (ddof=1 for the
+            # rolling window), so a zero intensity reproduces the unshrunk matrix exactly
+            cov = self.calc_raw_covariance()
+            if self.shrinkage is not None:
+                shrinkage = self.calc_shrinkage() if self.shrinkage == 'ledoit_wolf' else self.shrinkage
+                mu = np.trace(cov) / len(cov)
+                cov = ((1 - shrinkage) * cov) + (shrinkage * mu * np.eye(len(cov)))
+            self.cache['covariance'] = cov
+        return self.cache['covariance']
+
+    def calc_correlation(self):
+        if 'correlation' not in self.cache:
+            self.cache['correlation'] = correlation_from_covariance(self.calc_covariance())
+        return self.cache['correlation']
+
+    def calc_cholesky(self):
+        # Lower factor L with L @ L.T = covariance, so correlated normals for a simulation are Z @ L.T
+        if 'cholesky' not in self.cache:
+            self.cache['cholesky'], self.cache['jitter'] = cholesky_factor(self.calc_covariance())
+        return self.cache['cholesky']
+
+# Sample covariance over the last `window` bars (pandas DataFrame.rolling(window).cov() at the latest bar)
+# A ring buffer holds the window; running sums of x, x x^T, ||x||^2, ||x||^4 and ||x||^2 x are updated as bars enter
+# and leave, so an update costs O(n^2) and the Ledoit-Wolf moments of the centred window come out in O(n^2) as well
+class Rolling_Covariance(Covariance_Engine):
+    def __init__(self, window, shrinkage=None):
+        super().__init__(shrinkage)
+        self.window = window
+        self.buffer = None
+        self.pos = 0
+
+    def reset_sums(self, rows):
+        sq_norms = np.sum(rows ** 2, axis=1)
+        self.sums = np.sum(rows, axis=0)
+        self.outer = np.asfortranarray(rows.T @ rows)
+        self.sq_norm_sum = np.sum(sq_norms)
+        self.quartic_sum = np.sum(sq_norms ** 2)
+        self.weighted_sums = sq_norms @ rows
+
+    def add(self, x, sign):
+        sq_norm = x @ x
+        self.sums += sign * x
+        self.outer = dger(sign, x, x, a=self.outer, overwrite_a=True)
+        self.sq_norm_sum += sign * sq_norm
+        self.quartic_sum += sign * sq_norm ** 2
+        self.weighted_sums += sign * sq_norm * x
+
+    def update(self, returns):
+        x = np.asarray(returns, dtype=float)
+        if self.buffer is None:
+            self.buffer = np.zeros((self.window, len(x)))
+            self.reset_sums(self.buffer[:0])
+
+        if self.n_obs >= self.window:
+            self.add(self.buffer[self.pos], -1)
+        self.buffer[self.pos] = x
+        self.add(x, 1)
+        self.pos = (self.pos + 1) % self.window
+        self.n_obs += 1
+        self.cache = {}
+
+        # Resum the buffer once per cycle so floating-point drift in the running sums cannot build up
+        if self.pos == 0:
+            self.reset_sums(self.buffer)
+
+        return self
+
+    def compute(self, returns):
+        # Seeds the state with the tail of a (bars, tickers) history, one matrix product instead of a replay
+        returns = np.asarray(returns, dtype=float)
+        tail = returns[-self.window:]
+        self.buffer = np.zeros((self.window, returns.shape[1]))
+        self.buffer[:len(tail)] = tail
+        self.pos = len(tail) % self.window
+        self.n_obs = len(returns)
+        self.cache = {}
+        self.reset_sums(tail)
+
+        return self
+
+    def calc_raw_covariance(self):
+        if self.n_obs < self.window:
+            return np.full(self.outer.shape, np.nan)
+        return dger(-1 / (self.window * (self.window - 1)), self.sums, self.sums, a=np.asfortranarray(self.outer / (self.window - 1)), overwrite_a=True)
+
+    def calc_moments(self):
+        # Centred window moments: ||x - m||^4 expanded in the running sums, with c = ||m||^2
+        # Like the covariance, they are NaN until the window has filled
+        w = self.window
+        if self.n_obs < w:
+            nan = np.full(self.outer.shape, np.nan)
+            return nan, np.nan, 1 / w
+        m = self.sums / w
+        c = m @ m
+        cov = (self.outer / w) - np.outer(m, m)
+        quartic = self.quartic_sum + (4 * (m @ self.outer @ m)) - (4 * (m @ self.weighted_sums)) + (2 * c * self.sq_norm_sum) - (3 * w * c ** 2)
+        return cov, quartic / w, 1 / w
+
+# Exponentially weighted covariance with decay lam (RiskMetrics, zero mean): C_t = lam C_{t-1} + (1 - lam) x_t x_t^T,
+# normalised by the total weight so early estimates are not biased towards zero (pandas ewm(alpha=1 - lam) weights)
+class EWMA_Covariance(Covariance_Engine):
+    def __init__(self, lam=0.94, shrinkage=None):
+        super().__init__(shrinkage)
+        self.lam = lam
+        self.second_moment = None
+        self.quartic = 0
+        self.weight = 0
+        self.sq_weight = 0
+
+    def update(self, returns):
+        x = np.asarray(returns, dtype=float)
+        if self.second_moment is None:
+            self.second_moment = np.zeros((len(x), len(x)), order='F')
+
+        self.second_moment *= self.lam
+        self.second_moment = dger(1 - self.lam, x, x, a=self.second_moment, overwrite_a=True)
+        self.quartic = (self.lam * self.quartic) + ((1 - self.lam) * (x @ x) ** 2)
+        self.weight = (self.lam * self.weight) + (1 - self.lam)
+        self.sq_weight = (self.lam ** 2 * self.sq_weight) + ((1 - self.lam) ** 2)
+        self.n_obs += 1
+        self.cache = {}
+
+        return self
+
+    def compute(self, returns):
+        # Backfills from a (bars, tickers) history with one weighted matrix product instead of a replay
+        returns = np.asarray(returns, dtype=float)
+        weights = (1 - self.lam) * (self.lam ** np.arange(len(returns) - 1, -1, -1))
+
+        self.second_moment = np.asfortranarray((returns * weights[:, None]).T @ returns)
+        self.quartic = weights @ (np.sum(returns ** 2, axis=1) ** 2)
+        self.weight = np.sum(weights)
+        self.sq_weight = np.sum(weights ** 2)
+        self.n_obs = len(returns)
+        self.cache = {}
+
+        return self
+
+    def calc_raw_covariance(self):
+        return self.second_moment / self.weight
+
+    def calc_moments(self):
+        return self.second_moment / self.weight, self.quartic / self.weight, self.sq_weight / self.weight ** 2
@@ -0,0 +1,85 @@
+import warnings
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from statsmodels.tsa.stattools import adfuller
+from statsmodels.tsa.arima.model import ARIMA
+
+# Fits one candidate order, kept at module level so it can run in a worker process
+def fit_order(series, order, start_params=None):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            results = ARIMA(series, order=order).fit(start_params=start_params)
+        except Exception:
+            return order, np.inf, np.inf, None
+
+    return order, results.aic, results.bic, results.params
+
+# ARIMA forecasting pipeline with a per-ticker model cache
+# A repeat request on unchanged data reuses the fitted model, new or revised latest bars trigger a refit warm-started
+# from the previous parameters, and the (p, d, q) order is chosen by AIC/BIC over a grid searched in a process pool
+class ARIMA_Forecaster:
+    def __init__(self, max_p=3, max_q=3, criterion='aic', max_workers=None):
+        self.max_p = max_p
+        self.max_q = max_q
+        self.criterion = criterion.lower()
+        self.max_workers = max_workers
+        self.executor = None
+        self.cache = {}
+
+        if self.criterion not in ('aic', 'bic'):
+            raise ValueError(f"Unknown criterion '{criterion}' (expected 'aic' or 'bic').")
+
+    def select_order(self, series, adf=None):
+        # Differencing order from the ADF test, as on the analysis page
+        adf = adfuller(series) if adf is None else adf
+        d = 1 if adf[1] > 0.05 else 0
+
+        # One pool per forecaster, started on the first search and reused by later ones. Workers are spawned rather than
+        # forked, since the forecaster runs inside the multithreaded Streamlit server
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        orders = [(p, d, q) for p in range(self.max_p + 1) for q in range(self.max_q + 1)]
+        fits = list(self.executor.map(fit_order, [series] * len(orders), orders))
+
+        scores = {order: {'aic': aic, 'bic': bic} for order, aic, bic, _ in fits}
+        best = min(fits, key=lambda fit: fit[1] if self.criterion == 'aic' else fit[2])
+        if best[3] is None:
+            raise ValueError("No candidate ARIMA order could be fitted.")
+
+        return best[0], best[3], adf, scores
+
+    def fit(self, ticker, series):
+        # Copied, since the cached series is compared against the next call's data
+        series = np.array(series, dtype=float)
+        entry = self.cache.get(ticker)
+
+        if entry is not None and np.array_equal(entry['series'], series):
+            return entry
+
+        # Same history up to the previously last bar, which may have been revised (today's bar re-downloaded during
+        # market hours), with or without new bars after it: keep the order and warm-start from the previous parameters
+        # The ADF test is cheap, so it is rerun on the new series and a change in differencing order triggers a full
+        # order search; the AIC/BIC scores are those of the last search
+        adf = None
+        if entry is not None and len(series) >= len(entry['series']) and np.array_equal(series[:len(entry['series']) - 1], entry['series'][:-1]):
+            adf = adfuller(series)
+            if (1 if adf[1] > 0.05 else 0) == entry['order'][1]:
+                order, start_params, scores = entry['order'], entry['results'].params, entry['scores']
+            else:
+                order, start_params, adf, scores = self.select_order(series, adf)
+        else:
+            order, start_params, adf, scores = self.select_order(series)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results = ARIMA(series, order=order).fit(start_params=start_params)
+
+        entry = {'series': series, 'order': order, 'results': results, 'adf': adf, 'scores': scores}
+        self.cache[ticker] = entry
+        return entry
+
+    def forecast(self, ticker, series, steps):
+        return self.fit(ticker, series)['results'].forecast(steps=steps)
@@ -0,0 +1,81 @@
+import numpy as np
+from black_scholes import Black_Scholes_Pricing
+
+# Delta-hedging backtest of a short option over simulated paths (one row per day, e.g. Monte_Carlo_Pricing.S_n)
+# Deltas for every path come from one vectorized Black_Scholes_Pricing per rebalance date, and the hedge
+# portfolio (shares, cash, costs) is carried forward day by day so memory stays at O(paths) beyond the paths
+class Delta_Hedging_Simulator:
+    def __init__(self, paths, strike_price, days_to_maturity, risk_free_rate, dividends, sigma, contract_type, rebalance_every=1, proportional_cost=0.0, fixed_cost=0.0):
+        self.paths = paths
+        self.K = strike_price
+        self.days = days_to_maturity
+        self.r = risk_free_rate
+        self.q = dividends
+        self.sigma = sigma
+        self.contract_type = contract_type.lower()
+        self.rebalance_every = rebalance_every
+        self.proportional_cost = proportional_cost
+        self.fixed_cost = fixed_cost
+
+        self.premium = None
+        self.pnl = None
+        self.costs = None
+        self.trades = None
+
+        if paths.shape[0] != days_to_maturity + 1:
+            raise ValueError(f"Expected {days_to_maturity + 1} rows of daily prices, got {paths.shape[0]}.")
+
+        self.simulate()
+
+    def calc_cost(self, shares_traded, spot):
+        traded = np.abs(shares_traded)
+        return (self.proportional_cost * traded * spot) + (self.fixed_cost * (traded > 0))
+
+    def calc_delta(self, spot, days_left):
+        return Black_Scholes_Pricing(spot, self.K, days_left, self.r, self.q, self.sigma, self.contract_type).calc_delta()
+
+    def simulate(self):
+        dt = 1 / 365
+        spot = np.asarray(self.paths[0])
+
+        # Sell the option at the model price and buy the initial hedge
+        option = Black_Scholes_Pricing(spot, self.K, self.days, self.r, self.q, self.sigma, self.contract_type)
+        self.premium = option.price
+        delta = option.calc_delta()
+        costs = self.calc_cost(delta, spot)
+        cash = self.premium - (delta * spot) - costs
+        trades = np.ones(spot.shape, dtype=int)
+
+        for t in range(1, self.days + 1):
+            spot = np.asarray(self.paths[t])
+            cash = (cash * np.exp(self.r * dt)) + (delta * spot * self.q * dt)
+
+            if t % self.rebalance_every == 0 and t < self.days:
+                new_delta = self.calc_delta(spot, self.days - t)
+                trade_cost = self.calc_cost(new_delta - delta, spot)
+                cash -= ((new_delta - delta) * spot) + trade_cost
+                costs = costs + trade_cost
+                trades += 1
+                delta = new_delta
+
+        # Unwind at maturity: the hedge is sold at the final spot, paying the same costs as any other trade, and the
+        # option payoff owed is settled in cash
+        payoff = np.maximum(spot - self.K, 0) if self.contract_type == 'call' else np.maximum(self.K - spot, 0)
+        unwind_cost = self.calc_cost(delta, spot)
+        self.pnl = cash + (delta * spot) - unwind_cost - payoff
+        self.costs = costs + unwind_cost
+        self.trades = trades + (delta != 0)
+
+    def calc_hedging_error(self):
+        # P&L before transaction costs, i.e. the pure discretisation error of the hedge
+        return self.pnl + self.costs
+
+    def calc_summary(self):
+        error = self.calc_hedging_error()
+        return {
+            "Mean P&L": np.mean(self.pnl),
+            "P&L Std Dev": np.std(self.pnl),
+            "Hedging Error Std Dev": np.std(error),
+            "Mean Cost Drag": np.mean(self.costs),
+            "Rebalances": int(np.max(self.trades)),
+        }
@@ -0,0 +1,100 @@
+import numpy as np
+from opt_pricing import Option_Pricing
+
+# Implementation of Monte-Carlo simulation under Heston stochastic volatility for European Options pricing
+# Variance is stepped with Andersen's quadratic-exponential (QE) scheme, which stays unbiased at large time steps
+# sigma is the current volatility, so the initial variance is v0 = sigma ** 2
+class Heston_Monte_Carlo_Pricing(Option_Pricing):
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, iterations, kappa, theta, xi, rho, steps=None, full_path=True, chunk_size=None):
+        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a')
+        self.iter = iterations
+        self.kappa = kappa
+        self.theta = theta
+        self.xi = xi
+        self.rho = rho
+        self.steps = steps if steps is not None else days_to_maturity
+        self.full_path = full_path
+        self.chunk_size = chunk_size if chunk_size is not None else iterations
+        self.S_n = None
+        self.V_n = None
+        self.call_price = None
+        self.put_price = None
+
+        self.simulate(self.steps)
+
+        self.calc_call_price()
+        self.calc_put_price()
+
+    def simulate(self, steps):
+        dt = self.T / steps
+        np.random.seed(0)
+
+        # S_n keeps every step when full_path is set, otherwise only the terminal row so S_n[-1] still works
+        rows = steps + 1 if self.full_path else 1
+        self.S_n = np.zeros((rows, self.iter))
+        self.V_n = np.zeros((rows, self.iter)) if self.full_path else None
+
+        for start in range(0, self.iter, self.chunk_size):
+            end = min(start + self.chunk_size, self.iter)
+            self.simulate_chunk(start, end, steps, dt)
+
+    def simulate_chunk(self, start, end, steps, dt):
+        n = end - start
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+
+        # Constants of the QE variance step and the log-price discretisation (gamma1 = gamma2 = 0.5)
+        exp_kdt = np.exp(-kappa * dt)
+        c1 = (xi ** 2) * exp_kdt * (1 - exp_kdt) / kappa
+        c2 = theta * (xi ** 2) * ((1 - exp_kdt) ** 2) / (2 * kappa)
+        psi_c = 1.5
+
+        K0 = -rho * kappa * theta * dt / xi
+        K1 = (0.5 * dt * ((kappa * rho / xi) - 0.5)) - (rho / xi)
+        K2 = (0.5 * dt * ((kappa * rho / xi) - 0.5)) + (rho / xi)
+        K3 = 0.5 * dt * (1 - (rho ** 2))
+
+        log_S = np.full(n, np.log(self.S))
+        V = np.full(n, self.sigma ** 2)
+
+        if self.full_path:
+            self.S_n[0, start:end] = self.S
+            self.V_n[0, start:end] = V
+
+        for t in range(1, steps + 1):
+            m = theta + ((V - theta) * exp_kdt)
+            s2 = (V * c1) + c2
+            psi = s2 / (m ** 2)
+
+            Z_v = np.random.standard_normal(n)
+            U = np.random.uniform(size=n)
+            V_next = np.empty(n)
+
+            # Quadratic branch for low psi: V' = a (b + Z) ** 2
+            quad = psi <= psi_c
+            inv_psi = 2 / psi[quad]
+            b2 = inv_psi - 1 + (np.sqrt(inv_psi) * np.sqrt(inv_psi - 1))
+            a = m[quad] / (1 + b2)
+            V_next[quad] = a * ((np.sqrt(b2) + Z_v[quad]) ** 2)
+
+            # Exponential branch for high psi: point mass at zero plus an exponential tail
+            expo = ~quad
+            p = (psi[expo] - 1) / (psi[expo] + 1)
+            beta = (1 - p) / m[expo]
+            V_next[expo] = np.where(U[expo] <= p, 0, np.log((1 - p) / np.maximum(1 - U[expo], 1e-300)) / beta)
+
+            Z_s = np.random.standard_normal(n)
+            log_S += (self.r * dt) + K0 + (K1 * V) + (K2 * V_next) + (np.sqrt(K3 * (V + V_next)) * Z_s)
+            V = V_next
+
+            if self.full_path:
+                self.S_n[t, start:end] = np.exp(log_S)
+                self.V_n[t, start:end] = V
+
+        if not self.full_path:
+            self.S_n[0, start:end] = np.exp(log_S)
+
+    def calc_call_price(self):
+        self.call_price = np.exp(-self.r * self.T) * (1 / self.iter) * np.sum(np.maximum(self.S_n[-1] - self.K, 0))
+
+    def calc_put_price(self):
+        self.put_price = np.exp(-self.r * self.T) * (1 / self.iter) * np.sum(np.maximum(self.K - self.S_n[-1], 0))
@@ -0,0 +1,133 @@
+import numpy as np
+from scipy.signal import lfilter
+
+# Smoothing indicators that backfill a full history in vectorized form and then update in O(1) per new observation
+# Every indicator accepts a scalar series or a 2D (observations, series) array to smooth many tickers at once
+
+# Local-level Kalman filter (random-walk state observed with noise), equivalent to
+# pykalman.KalmanFilter(transition_matrices=[1], observation_matrices=[1], ...).filter
+class Kalman_Filter:
+    def __init__(self, transition_covariance, observation_covariance, initial_state_mean=0, initial_state_covariance=1, tol=1e-15):
+        self.Q = transition_covariance
+        self.R = observation_covariance
+        self.state_mean = initial_state_mean
+        self.state_covariance = initial_state_covariance
+        self.tol = tol
+        self.n_obs = 0
+
+    def update(self, observation):
+        # The first observation updates the initial state directly, later ones after a random-walk prediction
+        P = self.state_covariance + (self.Q if self.n_obs > 0 else 0)
+        gain = P / (P + self.R)
+
+        self.state_mean = self.state_mean + (gain * (np.asarray(observation, dtype=float) - self.state_mean))
+        self.state_covariance = (1 - gain) * P
+        self.n_obs += 1
+
+        return self.state_mean
+
+    def filter(self, observations):
+        observations = np.asarray(observations, dtype=float)
+        n = len(observations)
+        means = np.empty_like(observations)
+
+        # The gain sequence does not depend on the data, so step it only until it settles at its steady state
+        t = 0
+        while t < n:
+            P = self.state_covariance + (self.Q if self.n_obs > 0 else 0)
+            gain = P / (P + self.R)
+            settled = self.n_obs > 0 and abs((1 - gain) * P - self.state_covariance) <= self.tol * self.state_covariance
+
+            if settled:
+                break
+
+            means[t] = self.update(observations[t])
+            t += 1
+
+        # Past that point the filter is a fixed first-order recursion: x_t = (1 - K) x_{t-1} + K z_t
+        if t < n:
+            zi = np.asarray((1 - gain) * np.broadcast_to(self.state_mean, observations.shape[1:]))[None]
+            means[t:], _ = lfilter([gain], [1, -(1 - gain)], observations[t:], axis=0, zi=zi)
+
+            self.state_mean = means[-1].copy()
+            self.state_covariance = (1 - gain) * P
+            self.n_obs += n - t
+
+        return means
+
+# Simple moving average over a fixed window, NaN until the window is full and while it holds a NaN
+# (pandas rolling(window).mean()). NaNs are left out of the running total and counted separately, so the average
+# recovers as soon as a gap has left the window
+class Simple_Moving_Average:
+    def __init__(self, window):
+        self.window = window
+        self.buffer = None
+        self.pos = 0
+        self.total = 0
+        self.valid = 0
+
+    def update(self, value):
+        value = np.asarray(value, dtype=float)
+        if self.buffer is None:
+            self.buffer = np.full((self.window,) + value.shape, np.nan)
+
+        # Empty slots start as NaN, so the slot being replaced can always be taken out of the total and count
+        old = self.buffer[self.pos]
+        self.total = self.total - np.nan_to_num(old) + np.nan_to_num(value)
+        self.valid = self.valid - ~np.isnan(old) + ~np.isnan(value)
+        self.buffer[self.pos] = value
+        self.pos = (self.pos + 1) % self.window
+
+        # Resum the buffer once per cycle so floating-point drift in the running total cannot build up
+        if self.pos == 0:
+            self.total = np.nansum(self.buffer, axis=0)
+
+        return np.where(self.valid == self.window, self.total / self.window, np.nan)[()]
+
+    def compute(self, values):
+        values = np.asarray(values, dtype=float)
+        averages = np.full(values.shape, np.nan)
+
+        valid = ~np.isnan(values)
+        sums = np.cumsum(np.where(valid, values, 0), axis=0)
+        counts = np.cumsum(valid, axis=0)
+        if len(values) >= self.window:
+            window_sums = sums[self.window - 1:].copy()
+            window_sums[1:] -= sums[:-self.window]
+            window_counts = counts[self.window - 1:].copy()
+            window_counts[1:] -= counts[:-self.window]
+            averages[self.window - 1:] = np.where(window_counts == self.window, window_sums / self.window, np.nan)
+
+        # Seed the live state with the tail of the history so update() continues where compute() left off
+        tail = values[-self.window:]
+        self.buffer = np.full((self.window,) + values.shape[1:], np.nan)
+        self.buffer[:len(tail)] = tail
+        self.pos = len(tail) % self.window
+        self.total = np.nansum(tail, axis=0)
+        self.valid = np.sum(~np.isnan(tail), axis=0)
+
+        return averages
+
+# Exponential moving average with alpha = 2 / (span + 1), seeded with the first value (pandas ewm(span, adjust=False).mean())
+class Exponential_Moving_Average:
+    def __init__(self, span):
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self.value = None
+
+    def update(self, value):
+        value = np.asarray(value, dtype=float)
+        self.value = value if self.value is None else self.value + (self.alpha * (value - self.value))
+        return self.value
+
+    def compute(self, values):
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return values.copy()
+
+        start = values[0] if self.value is None else self.value
+        zi = np.asarray((1 - self.alpha) * np.broadcast_to(start, values.shape[1:]))[None]
+        averages, _ = lfilter([self.alpha], [1, -(1 - self.alpha)], values, axis=0, zi=zi)
+        self.value = averages[-1].copy()
+
+        return averages
@@ -0,0 +1,288 @@
+import numpy as np
+
+# Inner loops of the lattice and path models, with a Numba-compiled backend used automatically when Numba is installed
+# and a pure-NumPy fallback otherwise. Both backends fill the caller's preallocated arrays in place.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+BACKENDS = ['numba', 'numpy'] if NUMBA_AVAILABLE else ['numpy']
+DEFAULT_BACKEND = BACKENDS[0]
+
+# Early exercise at one level: records the step's boundaries and returns the exercised call/put values
+def early_exercise_numpy(spots, K, call_cont, put_cont, i, call_boundary, put_boundary):
+    call_ex = spots - K
+    put_ex = K - spots
+    call_early = (call_ex > call_cont) & (call_ex > 0)
+    put_early = (put_ex > put_cont) & (put_ex > 0)
+
+    if call_early.any():
+        call_boundary[i] = spots[call_early].min()
+    if put_early.any():
+        put_boundary[i] = spots[put_early].max()
+
+    return np.maximum(call_cont, call_ex), np.maximum(put_cont, put_ex)
+
+# Binomial lattice: ST[i, j] = S * u^(i - j) * d^j, call/put values stepped back with up-probability p
+# For American exercise the boundaries hold, per step, the lowest spot where the call and the highest spot
+# where the put is exercised early (NaN where exercise is never optimal)
+def binomial_lattice_numpy(ST, call, put, S, K, u, d, p, disc, american, call_boundary, put_boundary):
+    n = ST.shape[0] - 1
+    for i in range(n + 1):
+        j = np.arange(i + 1)
+        ST[i, :i + 1] = S * (u ** (i - j)) * (d ** j)
+
+    call[n] = np.maximum(0, ST[n] - K)
+    put[n] = np.maximum(0, K - ST[n])
+
+    for i in range(n - 1, -1, -1):
+        call_cont = disc * ((p * call[i + 1, :i + 1]) + ((1 - p) * call[i + 1, 1:i + 2]))
+        put_cont = disc * ((p * put[i + 1, :i + 1]) + ((1 - p) * put[i + 1, 1:i + 2]))
+
+        if american:
+            call_cont, put_cont = early_exercise_numpy(ST[i, :i + 1], K, call_cont, put_cont, i, call_boundary, put_boundary)
+
+        call[i, :i + 1] = call_cont
+        put[i, :i + 1] = put_cont
+
+# Trinomial lattice: ST[steps + k, i] = S * u^k for |k| <= i, moving to k + 1, k, k - 1 with pu, pm, pd
+def trinomial_lattice_numpy(ST, call, put, S, K, u, pu, pm, pd, disc, american, call_boundary, put_boundary):
+    n = ST.shape[1] - 1
+    for i in range(n + 1):
+        k = np.arange(-i, i + 1)
+        ST[n - i:n + i + 1, i] = S * (u ** k)
+
+    call[:, n] = np.maximum(0, ST[:, n] - K)
+    put[:, n] = np.maximum(0, K - ST[:, n])
+
+    for i in range(n - 1, -1, -1):
+        lo = n - i
+        hi = n + i + 1
+        call_cont = disc * ((pu * call[lo + 1:hi + 1, i + 1]) + (pm * call[lo:hi, i + 1]) + (pd * call[lo - 1:hi - 1, i + 1]))
+        put_cont = disc * ((pu * put[lo + 1:hi + 1, i + 1]) + (pm * put[lo:hi, i + 1]) + (pd * put[lo - 1:hi - 1, i + 1]))
+
+        if american:
+            call_cont, put_cont = early_exercise_numpy(ST[lo:hi, i], K, call_cont, put_cont, i, call_boundary, put_boundary)
+
+        call[lo:hi, i] = call_cont
+        put[lo:hi, i] = put_cont
+
+# Compact lattices: level i of the call/put values starts at offsets[i], in the same node order as ST[i, :i + 1]
+# (binomial) or ST[steps - i:steps + i + 1, i] (trinomial), and node spots are recomputed instead of stored.
+# Packed offsets (see lattice.Packed_Lattice) keep every level; all-zero offsets roll back in place through a single
+# level buffer, which is safe because node j of level i only reads nodes j and above of level i + 1
+def binomial_packed_numpy(call, put, offsets, S, K, u, d, p, disc, american, call_boundary, put_boundary):
+    n = call_boundary.shape[0] - 1
+    j = np.arange(n + 1)
+    lo = offsets[n]
+    spots = S * (u ** (n - j)) * (d ** j)
+    call[lo:lo + n + 1] = np.maximum(0, spots - K)
+    put[lo:lo + n + 1] = np.maximum(0, K - spots)
+
+    for i in range(n - 1, -1, -1):
+        nxt = lo
+        lo = offsets[i]
+        call_cont = disc * ((p * call[nxt:nxt + i + 1]) + ((1 - p) * call[nxt + 1:nxt + i + 2]))
+        put_cont = disc * ((p * put[nxt:nxt + i + 1]) + ((1 - p) * put[nxt + 1:nxt + i + 2]))
+
+        if american:
+            spots = S * (u ** (i - j[:i + 1])) * (d ** j[:i + 1])
+            call_cont, put_cont = early_exercise_numpy(spots, K, call_cont, put_cont, i, call_boundary, put_boundary)
+
+        call[lo:lo + i + 1] = call_cont
+        put[lo:lo + i + 1] = put_cont
+
+def trinomial_packed_numpy(call, put, offsets, S, K, u, pu, pm, pd, disc, american, call_boundary, put_boundary):
+    n = call_boundary.shape[0] - 1
+    lo = offsets[n]
+    spots = S * (u ** np.arange(-n, n + 1))
+    call[lo:lo + 2 * n + 1] = np.maximum(0, spots - K)
+    put[lo:lo + 2 * n + 1] = np.maximum(0, K - spots)
+
+    for i in range(n - 1, -1, -1):
+        nxt = lo
+        lo = offsets[i]
+        width = 2 * i + 1
+        call_cont = disc * ((pu * call[nxt + 2:nxt + width + 2]) + (pm * call[nxt + 1:nxt + width + 1]) + (pd * call[nxt:nxt + width]))
+        put_cont = disc * ((pu * put[nxt + 2:nxt + width + 2]) + (pm * put[nxt + 1:nxt + width + 1]) + (pd * put[nxt:nxt + width]))
+
+        if american:
+            spots = S * (u ** np.arange(-i, i + 1))
+            call_cont, put_cont = early_exercise_numpy(spots, K, call_cont, put_cont, i, call_boundary, put_boundary)
+
+        call[lo:lo + width] = call_cont
+        put[lo:lo + width] = put_cont
+
+# GBM paths from a (days, paths) block of standard normals: S_n[t] = S_n[t - 1] * exp(drift + vol * Z[t - 1])
+def gbm_paths_numpy(S_n, S, drift, vol, Z):
+    S_n[0] = S
+    S_n[1:] = S * np.exp(np.cumsum(drift + (vol * Z), axis=0))
+
+# Flags the paths (columns) that touch the barrier at any monitoring date
+def barrier_hits_numpy(S_n, barrier, up):
+    return (S_n >= barrier).any(axis=0) if up else (S_n <= barrier).any(axis=0)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def binomial_lattice_numba(ST, call, put, S, K, u, d, p, disc, american, call_boundary, put_boundary):
+        n = ST.shape[0] - 1
+        ST[0, 0] = S
+        for i in range(1, n + 1):
+            ST[i, 0] = ST[i - 1, 0] * u
+            for j in range(1, i + 1):
+                ST[i, j] = ST[i - 1, j - 1] * d
+
+        for j in range(n + 1):
+            call[n, j] = max(0.0, ST[n, j] - K)
+            put[n, j] = max(0.0, K - ST[n, j])
+
+        for i in range(n - 1, -1, -1):
+            for j in range(i + 1):
+                call_value = disc * ((p * call[i + 1, j]) + ((1 - p) * call[i + 1, j + 1]))
+                put_value = disc * ((p * put[i + 1, j]) + ((1 - p) * put[i + 1, j + 1]))
+
+                if american:
+                    call_ex = ST[i, j] - K
+                    put_ex = K - ST[i, j]
+                    if call_ex > call_value and call_ex > 0:
+                        call_value = call_ex
+                        if np.isnan(call_boundary[i]) or ST[i, j] < call_boundary[i]:
+                            call_boundary[i] = ST[i, j]
+                    if put_ex > put_value and put_ex > 0:
+                        put_value = put_ex
+                        if np.isnan(put_boundary[i]) or ST[i, j] > put_boundary[i]:
+                            put_boundary[i] = ST[i, j]
+
+                call[i, j] = call_value
+                put[i, j] = put_value
+
+    @njit(cache=True)
+    def trinomial_lattice_numba(ST, call, put, S, K, u, pu, pm, pd, disc, american, call_boundary, put_boundary):
+        n = ST.shape[1] - 1
+        ST[n, 0] = S
+        for i in range(1, n + 1):
+            ST[n - i, i] = ST[n - i + 1, i - 1] / u
+            ST[n + i, i] = ST[n + i - 1, i - 1] * u
+            for r in range(n - i + 1, n + i):
+                ST[r, i] = ST[r, i - 1]
+
+        for r in range(2 * n + 1):
+            call[r, n] = max(0.0, ST[r, n] - K)
+            put[r, n] = max(0.0, K - ST[r, n])
+
+        for i in range(n - 1, -1, -1):
+            for r in range(n - i, n + i + 1):
+                call_value = disc * ((pu * call[r + 1, i + 1]) + (pm * call[r, i + 1]) + (pd * call[r - 1, i + 1]))
+                put_value = disc * ((pu * put[r + 1, i + 1]) + (pm * put[r, i + 1]) + (pd * put[r - 1, i + 1]))
+
+                if american:
+                    call_ex = ST[r, i] - K
+                    put_ex = K - ST[r, i]
+                    if call_ex > call_value and call_ex > 0:
+                        call_value = call_ex
+                        if np.isnan(call_boundary[i]) or ST[r, i] < call_boundary[i]:
+                            call_boundary[i] = ST[r, i]
+                    if put_ex > put_value and put_ex > 0:
+                        put_value = put_ex
+                        if np.isnan(put_boundary[i]) or ST[r, i] > put_boundary[i]:
+                            put_boundary[i] = ST[r, i]
+
+                call[r, i] = call_value
+                put[r, i] = put_value
+
+    @njit(cache=True)
+    def binomial_packed_numba(call, put, offsets, S, K, u, d, p, disc, american, call_boundary, put_boundary):
+        n = call_boundary.shape[0] - 1
+        lo = offsets[n]
+        for j in range(n + 1):
+            spot = S * (u ** (n - j)) * (d ** j)
+            call[lo + j] = max(0.0, spot - K)
+            put[lo + j] = max(0.0, K - spot)
+
+        for i in range(n - 1, -1, -1):
+            nxt = lo
+            lo = offsets[i]
+            spot = S * (u ** i)
+            for j in range(i + 1):
+                call_value = disc * ((p * call[nxt + j]) + ((1 - p) * call[nxt + j + 1]))
+                put_value = disc * ((p * put[nxt + j]) + ((1 - p) * put[nxt + j + 1]))
+
+                if american:
+                    call_ex = spot - K
+                    put_ex = K - spot
+                    if call_ex > call_value and call_ex > 0:
+                        call_value = call_ex
+                        if np.isnan(call_boundary[i]) or spot < call_boundary[i]:
+                            call_boundary[i] = spot
+                    if put_ex > put_value and put_ex > 0:
+                        put_value = put_ex
+                        if np.isnan(put_boundary[i]) or spot > put_boundary[i]:
+                            put_boundary[i] = spot
+
+                call[lo + j] = call_value
+                put[lo + j] = put_value
+                spot *= d / u
+
+    @njit(cache=True)
+    def trinomial_packed_numba(call, put, offsets, S, K, u, pu, pm, pd, disc, american, call_boundary, put_boundary):
+        n = call_boundary.shape[0] - 1
+        lo = offsets[n]
+        for m in range(2 * n + 1):
+            spot = S * (u ** (m - n))
+            call[lo + m] = max(0.0, spot - K)
+            put[lo + m] = max(0.0, K - spot)
+
+        for i in range(n - 1, -1, -1):
+            nxt = lo
+            lo = offsets[i]
+            spot = S * (u ** -i)
+            for m in range(2 * i + 1):
+                call_value = disc * ((pu * call[nxt + m + 2]) + (pm * call[nxt + m + 1]) + (pd * call[nxt + m]))
+                put_value = disc * ((pu * put[nxt + m + 2]) + (pm * put[nxt + m + 1]) + (pd * put[nxt + m]))
+
+                if american:
+                    call_ex = spot - K
+                    put_ex = K - spot
+                    if call_ex > call_value and call_ex > 0:
+                        call_value = call_ex
+                        if np.isnan(call_boundary[i]) or spot < call_boundary[i]:
+                            call_boundary[i] = spot
+                    if put_ex > put_value and put_ex > 0:
+                        put_value = put_ex
+                        if np.isnan(put_boundary[i]) or spot > put_boundary[i]:
+                            put_boundary[i] = spot
+
+                call[lo + m] = call_value
+                put[lo + m] = put_value
+                spot *= u
+
+    @njit(cache=True)
+    def gbm_paths_numba(S_n, S, drift, vol, Z):
+        for j in range(S_n.shape[1]):
+            S_n[0, j] = S
+        for t in range(1, S_n.shape[0]):
+            for j in range(S_n.shape[1]):
+                S_n[t, j] = S_n[t - 1, j] * np.exp(drift + (vol * Z[t - 1, j]))
+
+    @njit(cache=True)
+    def barrier_hits_numba(S_n, barrier, up):
+        # Walks each path only until its first crossing
+        hits = np.zeros(S_n.shape[1], dtype=np.bool_)
+        for j in range(S_n.shape[1]):
+            for t in range(S_n.shape[0]):
+                if (up and S_n[t, j] >= barrier) or (not up and S_n[t, j] <= barrier):
+                    hits[j] = True
+                    break
+        return hits
+
+def get_kernel(name, backend=None):
+    backend = DEFAULT_BACKEND if backend is None else backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend '{backend}' is not available (available: {BACKENDS}).")
+    return globals()[f"{name}_{backend}"]
+
+# Memory-mapped arrays are passed as plain ndarray views so both backends see the same (uncopied) buffer
+def as_ndarray(array):
+    return array.view(np.ndarray) if isinstance(array, np.memmap) else array
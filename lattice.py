@@ -0,0 +1,83 @@
+import numpy as np
+
+# Node spots of a recombining binomial tree, evaluated on demand so a tree of any depth costs no node storage
+# Level i holds S * u^(i - j) * d^j for j = 0..i, in the same order as Binomial_Pricing.ST[i, :i + 1]
+class Binomial_Lattice:
+    def __init__(self, spot_price, u, d, steps):
+        self.S = spot_price
+        self.u = u
+        self.d = d
+        self.steps = steps
+
+    def __len__(self):
+        return self.steps + 1
+
+    def width(self, i):
+        return i + 1
+
+    def level(self, i):
+        j = np.arange(i + 1)
+        return self.S * (self.u ** (i - j)) * (self.d ** j)
+
+    def node(self, i, j):
+        return self.S * (self.u ** (i - j)) * (self.d ** j)
+
+    def edges(self, i):
+        # (parent, child) node indices of the moves from level i - 1 into level i
+        parents = np.repeat(np.arange(i), 2)
+        return parents, parents + np.tile([0, 1], i)
+
+    def bounds(self):
+        return self.S * (self.d ** self.steps), self.S * (self.u ** self.steps)
+
+# Node spots of a recombining trinomial tree, evaluated on demand
+# Level i holds S * u^k for k = -i..i, in the same order as Trinomial_Pricing.ST[steps - i:steps + i + 1, i]
+class Trinomial_Lattice:
+    def __init__(self, spot_price, u, steps):
+        self.S = spot_price
+        self.u = u
+        self.steps = steps
+
+    def __len__(self):
+        return self.steps + 1
+
+    def width(self, i):
+        return 2 * i + 1
+
+    def level(self, i):
+        return self.S * (self.u ** np.arange(-i, i + 1))
+
+    def node(self, i, m):
+        return self.S * (self.u ** (m - i))
+
+    def edges(self, i):
+        # Node m of level i - 1 moves down, across and up into nodes m, m + 1 and m + 2 of level i
+        parents = np.repeat(np.arange(2 * i - 1), 3)
+        return parents, parents + np.tile([0, 1, 2], 2 * i - 1)
+
+    def bounds(self):
+        return self.S * (self.u ** -self.steps), self.S * (self.u ** self.steps)
+
+# Per-node values (e.g. option values) of a lattice stored level after level in one flat array, without the zero
+# padding of the dense layouts. A binomial tree needs (steps + 1)(steps + 2) / 2 entries, a trinomial tree (steps + 1)^2
+# The compact pricers only keep their values this way with keep_values=True, otherwise they hold a single level
+class Packed_Lattice:
+    def __init__(self, values, widths):
+        self.values = values
+        self.offsets = np.concatenate(([0], np.cumsum(widths)))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def level(self, i):
+        # View into the flat array, so writes through it update the lattice
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def node(self, i, j):
+        return self.values[self.offsets[i] + j]
+
+def binomial_widths(steps):
+    return np.arange(1, steps + 2)
+
+def trinomial_widths(steps):
+    return (2 * np.arange(steps + 1)) + 1
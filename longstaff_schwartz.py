@@ -0,0 +1,85 @@
+import numpy as np
+from numpy.polynomial import laguerre, polynomial
+from opt_pricing import Option_Pricing
+
+# Regression bases on moneyness x = S / K, each returning a (paths, degree + 1) design matrix
+BASES = {
+    'laguerre': lambda x, degree: np.exp(-x / 2)[:, None] * laguerre.lagvander(x, degree),
+    'polynomial': lambda x, degree: polynomial.polyvander(x, degree),
+}
+
+# Implementation of Longstaff-Schwartz least-squares Monte-Carlo for American Options pricing
+# Paths are generated backward in time with a Brownian bridge: W_T is drawn first and each earlier W_t is sampled
+# conditional on the next one, so only the current date's values are held and memory is O(iterations) instead of
+# O(days * iterations). At each exercise date the discounted future cashflows of the in-the-money paths are regressed
+# on the basis functions, and paths exercise where the immediate payoff beats the fitted continuation value
+class Longstaff_Schwartz_Pricing(Option_Pricing):
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, iterations, exercise_dates=None, basis='laguerre', degree=3, seed=0):
+        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a')
+        if basis not in BASES:
+            raise ValueError(f"Unknown basis '{basis}' (expected one of {list(BASES)}).")
+
+        self.iter = iterations
+        self.exercise_dates = exercise_dates if exercise_dates is not None else days_to_maturity
+        self.basis = basis
+        self.degree = degree
+        self.seed = seed
+        self.call_price = None
+        self.put_price = None
+        self.call_se = None
+        self.put_se = None
+        self.call_cf = None
+        self.put_cf = None
+
+        self.simulate()
+
+        self.calc_call_price()
+        self.calc_put_price()
+
+    def regress(self, S_t, cashflow, exercise):
+        # Exercise decision for the in-the-money paths, others keep their discounted future cashflow
+        itm = exercise > 0
+        if itm.sum() <= self.degree + 1:
+            return cashflow
+
+        X = BASES[self.basis](S_t[itm] / self.K, self.degree)
+        coef = np.linalg.lstsq(X, cashflow[itm], rcond=None)[0]
+
+        exercised = np.zeros_like(itm)
+        exercised[itm] = exercise[itm] > X @ coef
+        return np.where(exercised, exercise, cashflow)
+
+    def simulate(self):
+        n = self.exercise_dates
+        dt = self.T / n
+        disc = np.exp(-self.r * dt)
+        drift = self.r - (0.5 * self.sigma ** 2)
+        rng = np.random.default_rng(self.seed)
+
+        # Terminal Brownian value and payoffs at maturity
+        W = np.sqrt(self.T) * rng.standard_normal(self.iter)
+        S_t = self.S * np.exp((drift * self.T) + (self.sigma * W))
+        call_cf = np.maximum(S_t - self.K, 0)
+        put_cf = np.maximum(self.K - S_t, 0)
+
+        for k in range(n - 1, 0, -1):
+            # Brownian bridge between W_0 = 0 and W_{t_k+1}: mean k / (k + 1) * W, variance k / (k + 1) * dt
+            t = k * dt
+            W = (k / (k + 1)) * W + np.sqrt((k / (k + 1)) * dt) * rng.standard_normal(self.iter)
+            S_t = self.S * np.exp((drift * t) + (self.sigma * W))
+
+            call_cf = self.regress(S_t, disc * call_cf, S_t - self.K)
+            put_cf = self.regress(S_t, disc * put_cf, self.K - S_t)
+
+        # Cashflows discounted to t = 0
+        self.call_cf = disc * call_cf
+        self.put_cf = disc * put_cf
+
+    # Immediate exercise at t = 0 is taken when it beats the estimated continuation value
+    def calc_call_price(self):
+        self.call_price = max(np.mean(self.call_cf), self.S - self.K)
+        self.call_se = np.std(self.call_cf) / np.sqrt(self.iter)
+
+    def calc_put_price(self):
+        self.put_price = max(np.mean(self.put_cf), self.K - self.S)
+        self.put_se = np.std(self.put_cf) / np.sqrt(self.iter)
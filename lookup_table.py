@@ -0,0 +1,117 @@
+import os
+import json
+import numpy as np
+
+from black_scholes import Black_Scholes_Pricing
+from binomial import Binomial_Pricing
+from trinomial import Trinomial_Pricing
+
+LATTICES = {
+    'binomial': Binomial_Pricing,
+    'trinomial': Trinomial_Pricing,
+}
+
+# Normalized prices: with no dividends, price / K depends only on moneyness S / K, total volatility sigma * sqrt(T)
+# and total rate r * T, for Black-Scholes and for a lattice with a fixed number of steps alike
+def normalized_prices(model, moneyness, total_vol, total_rate, steps=200, american=True):
+    # Returns (call, put) arrays over the moneyness values for one (total_vol, total_rate) point, priced at K = 100, T = 1
+    spots = 100 * np.asarray(moneyness, dtype=float)
+    if model == 'black_scholes':
+        call = Black_Scholes_Pricing(spots, 100, 365, total_rate, 0, total_vol, 'call').price
+        put = Black_Scholes_Pricing(spots, 100, 365, total_rate, 0, total_vol, 'put').price
+        return call / 100, put / 100
+
+    prices = [LATTICES[model](spot, 100, 365, total_rate, total_vol, steps, american=american) for spot in spots]
+    return np.array([option.call_price for option in prices]) / 100, np.array([option.put_price for option in prices]) / 100
+
+# Tabulates normalized call/put prices over moneyness x total vol x total rate and writes them to a directory:
+# prices.npy (2, n_moneyness, n_vol, n_rate), grids.npz and meta.json with interpolation errors measured on a sample
+def build_pricing_table(path, model='binomial', moneyness=None, total_vols=None, total_rates=None, steps=200, american=True, n_checks=500, seed=0):
+    if model != 'black_scholes' and model not in LATTICES:
+        raise ValueError(f"Unknown model '{model}' (expected 'black_scholes' or one of {list(LATTICES)}).")
+
+    moneyness = np.linspace(0.5, 2.0, 151) if moneyness is None else np.asarray(moneyness, dtype=float)
+    total_vols = np.linspace(0.02, 1.2, 80) if total_vols is None else np.asarray(total_vols, dtype=float)
+    total_rates = np.linspace(0.0, 0.2, 11) if total_rates is None else np.asarray(total_rates, dtype=float)
+
+    os.makedirs(path, exist_ok=True)
+    prices = np.lib.format.open_memmap(os.path.join(path, "prices.npy"), mode='w+', dtype=np.float64, shape=(2, len(moneyness), len(total_vols), len(total_rates)))
+    for j, total_vol in enumerate(total_vols):
+        for k, total_rate in enumerate(total_rates):
+            prices[0, :, j, k], prices[1, :, j, k] = normalized_prices(model, moneyness, total_vol, total_rate, steps, american)
+    prices.flush()
+    np.savez(os.path.join(path, "grids.npz"), moneyness=moneyness, total_vols=total_vols, total_rates=total_rates)
+
+    meta = {"model": model, "steps": steps, "american": american}
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(meta, f)
+    table = Pricing_Table(path)
+
+    # Interpolation error is largest between grid nodes, so compare against exact prices at random cell centres
+    # These are empirical estimates from n_checks cells, not a bound: a query elsewhere can exceed the sampled maximum
+    rng = np.random.default_rng(seed)
+    cells = [rng.integers(0, len(grid) - 1, n_checks) for grid in (moneyness, total_vols, total_rates)]
+    centres = [(grid[idx] + grid[idx + 1]) / 2 for grid, idx in zip((moneyness, total_vols, total_rates), cells)]
+    interpolated = table.interpolate(*centres)
+
+    errors = []
+    for i in range(n_checks):
+        call, put = normalized_prices(model, centres[0][i:i + 1], centres[1][i], centres[2][i], steps, american)
+        errors.append([abs(interpolated[0, i] - call[0]), abs(interpolated[1, i] - put[0])])
+    errors = np.array(errors)
+
+    table.meta.update({
+        "max_sampled_error": float(errors.max()),
+        "p99_error": float(np.percentile(errors, 99)),
+        "mean_error": float(errors.mean()),
+    })
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(table.meta, f)
+
+    return table
+
+# Read-only view of a built table, memory-mapped so every process that opens it shares the same pages
+# Errors in meta are per unit of strike and sampled at build time, so the dollar error estimate for a contract is
+# max_sampled_error * K
+class Pricing_Table:
+    def __init__(self, path):
+        self.prices = np.load(os.path.join(path, "prices.npy"), mmap_mode='r')
+        grids = np.load(os.path.join(path, "grids.npz"))
+        self.moneyness = grids["moneyness"]
+        self.total_vols = grids["total_vols"]
+        self.total_rates = grids["total_rates"]
+
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+
+    @staticmethod
+    def locate(grid, values):
+        # Lower cell index and fractional position, NaN weight outside the tabulated range
+        idx = np.clip(np.searchsorted(grid, values, side='right') - 1, 0, len(grid) - 2)
+        weight = (values - grid[idx]) / (grid[idx + 1] - grid[idx])
+        weight = np.where((values < grid[0]) | (values > grid[-1]), np.nan, weight)
+        return idx, weight
+
+    def interpolate(self, moneyness, total_vol, total_rate):
+        # Trilinear interpolation of both contract types, returns an array of shape (2,) + input shape
+        i, wi = self.locate(self.moneyness, moneyness)
+        j, wj = self.locate(self.total_vols, total_vol)
+        k, wk = self.locate(self.total_rates, total_rate)
+
+        result = 0
+        for di, fi in ((0, 1 - wi), (1, wi)):
+            for dj, fj in ((0, 1 - wj), (1, wj)):
+                for dk, fk in ((0, 1 - wk), (1, wk)):
+                    result = result + (self.prices[:, i + di, j + dj, k + dk] * (fi * fj * fk))
+        return result
+
+    def price(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, contract_type):
+        # Vectorized approximate prices, NaN for contracts outside the table's domain
+        spot_price, strike_price, days_to_maturity = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (spot_price, strike_price, days_to_maturity)))
+        T = days_to_maturity / 365
+        normalized = self.interpolate(spot_price / strike_price, sigma * np.sqrt(T), risk_free_rate * T)
+        return strike_price * normalized[0 if contract_type.lower() == 'call' else 1]
+
+    def calc_error_estimate(self, strike_price):
+        # Largest error seen at the sampled cell centres scaled to the strike, typical rather than worst case
+        return self.meta["max_sampled_error"] * np.asarray(strike_price, dtype=float)
@@ -0,0 +1,193 @@
+import os
+import json
+import threading
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+# Provider backed by Yahoo Finance (yfinance is only imported when a download is needed)
+class Yahoo_Provider:
+    def fetch(self, ticker, start=None, end=None):
+        import yfinance as yf
+
+        if start is None:
+            data = yf.download(ticker, end=end, period="max", auto_adjust=False, progress=False)
+        else:
+            data = yf.download(ticker, start=start, end=end, auto_adjust=False, progress=False)
+
+        # Newer yfinance versions return (field, ticker) column pairs even for a single ticker
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+
+        data = data.reset_index()
+        data["Date"] = pd.to_datetime(data["Date"])
+        return data
+
+# Stand-in provider for offline and test runs, reading <directory>/<ticker>.csv files with a Date column
+class File_Provider:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, ticker, start=None, end=None):
+        data = pd.read_csv(os.path.join(self.directory, f"{ticker}.csv"), parse_dates=["Date"])
+        if start is not None:
+            data = data[data["Date"] >= pd.Timestamp(start)]
+        if end is not None:
+            data = data[data["Date"] < pd.Timestamp(end)]
+        return data.reset_index(drop=True)
+
+# Local columnar cache of daily OHLCV history, one .npy file per column per ticker, read back memory-mapped
+# Only date ranges not yet covered are requested from the provider, along with the last stored complete bar to detect
+# restated history (dividends, splits), and window queries return views into the maps
+class Market_Data_Store:
+    def __init__(self, root, provider=None, max_workers=8):
+        self.root = root
+        self.provider = provider if provider is not None else Yahoo_Provider()
+        self.max_workers = max_workers
+        self.tables = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+
+        os.makedirs(root, exist_ok=True)
+
+    def ticker_lock(self, ticker):
+        with self.lock:
+            return self.locks.setdefault(ticker, threading.Lock())
+
+    def ticker_dir(self, ticker):
+        return os.path.join(self.root, ticker)
+
+    def read_meta(self, ticker):
+        path = os.path.join(self.ticker_dir(ticker), "meta.json")
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def open_table(self, ticker):
+        if ticker not in self.tables:
+            directory = self.ticker_dir(ticker)
+            table = {"Date": np.load(os.path.join(directory, "Date.npy"), mmap_mode="r")}
+            for col in COLUMNS:
+                table[col] = np.load(os.path.join(directory, f"{col}.npy"), mmap_mode="r")
+            self.tables[ticker] = table
+        return self.tables[ticker]
+
+    def write_table(self, ticker, frame, meta):
+        directory = self.ticker_dir(ticker)
+        os.makedirs(directory, exist_ok=True)
+
+        # Write to temporary files and swap them in so concurrent readers never see a half-written column
+        arrays = {"Date": frame["Date"].values.astype("datetime64[D]")}
+        for col in COLUMNS:
+            arrays[col] = frame[col].to_numpy(dtype=float) if col in frame else np.full(len(frame), np.nan)
+
+        for name, values in arrays.items():
+            tmp_path = os.path.join(directory, f"{name}.tmp.npy")
+            np.save(tmp_path, values)
+            os.replace(tmp_path, os.path.join(directory, f"{name}.npy"))
+
+        with open(os.path.join(directory, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+        self.tables.pop(ticker, None)
+
+    def refresh(self, ticker, start=None, end=None):
+        # start=None asks for the full available history, end is exclusive and defaults to tomorrow
+        start = None if start is None else np.datetime64(pd.Timestamp(start).date(), "D")
+        end = np.datetime64(pd.Timestamp(end).date() if end is not None else dt.date.today() + dt.timedelta(days=1), "D")
+
+        # Today's bar may still be forming, so coverage is recorded only up to today (exclusive) and the next refresh
+        # downloads the current day again, replacing any partial bar
+        complete_end = min(end, np.datetime64(dt.date.today(), "D"))
+
+        with self.ticker_lock(ticker):
+            meta = self.read_meta(ticker)
+            if meta is None:
+                frame = self.fetch(ticker, start, end)
+                if frame.empty:
+                    raise ValueError(f"No data found for ticker {ticker}.")
+                self.write_table(ticker, frame, {"start": None if start is None else str(start), "end": str(complete_end), "full": start is None})
+                return
+
+            covered_start = None if meta["full"] else np.datetime64(meta["start"], "D")
+            covered_end = min(np.datetime64(meta["end"], "D"), np.datetime64(dt.date.today(), "D"))
+            table = self.open_table(ticker)
+            last = np.searchsorted(table["Date"], np.datetime64(dt.date.today(), "D")) - 1
+
+            # The last stored complete bar is downloaded again with the tail: Yahoo restates Adj Close over the whole
+            # history at each dividend and Close / OHLC at each split, so a changed value means the cached rows are on an
+            # old basis and the whole covered range is replaced in one download
+            if last >= 0:
+                check_date = table["Date"][last]
+                tail = self.fetch(ticker, check_date, max(end, check_date + 1))
+                if self.is_revised(table, last, tail):
+                    refetch_start = None if start is None or covered_start is None else min(start, covered_start)
+                    frame = self.fetch(ticker, refetch_start, max(end, covered_end))
+                    self.write_table(ticker, frame, {"start": None if refetch_start is None else str(refetch_start), "end": str(max(covered_end, complete_end)), "full": refetch_start is None})
+                    return
+
+            # Only the gaps before and after the covered range are downloaded
+            pieces = []
+            if covered_start is not None and (start is None or start < covered_start):
+                pieces.append(self.fetch(ticker, start, covered_start))
+                covered_start = start
+            if end > covered_end:
+                pieces.append(tail[tail["Date"] > pd.Timestamp(check_date)] if last >= 0 else self.fetch(ticker, covered_end, end))
+                covered_end = max(covered_end, complete_end)
+
+            pieces = [piece for piece in pieces if not piece.empty]
+            new_meta = {"start": None if covered_start is None else str(covered_start), "end": str(covered_end), "full": covered_start is None}
+            if not pieces:
+                if new_meta != meta:
+                    with open(os.path.join(self.ticker_dir(ticker), "meta.json"), "w") as f:
+                        json.dump(new_meta, f)
+                return
+
+            frame = pd.concat([self.to_frame(self.open_table(ticker))] + pieces, ignore_index=True)
+            frame = frame.drop_duplicates(subset="Date", keep="last").sort_values("Date").reset_index(drop=True)
+            self.write_table(ticker, frame, new_meta)
+
+    @staticmethod
+    def is_revised(table, i, fresh):
+        # Whether the freshly downloaded bar on the date of stored row i has a different Close or Adj Close
+        row = fresh[fresh["Date"] == pd.Timestamp(table["Date"][i])]
+        if row.empty:
+            return True
+        return any(not np.isclose(row[col].iloc[0], table[col][i], rtol=1e-9, atol=0, equal_nan=True) for col in ("Close", "Adj Close") if col in row)
+
+    def fetch(self, ticker, start, end):
+        data = self.provider.fetch(ticker, None if start is None else str(start), str(end))
+        return data[["Date"] + [col for col in COLUMNS if col in data]]
+
+    def get_window(self, ticker, start=None, end=None):
+        # Returns {column: array} views into the memory-mapped columns for start <= Date < end, no copies
+        self.refresh(ticker, start, end)
+        with self.ticker_lock(ticker):
+            table = self.open_table(ticker)
+
+        lo = 0 if start is None else np.searchsorted(table["Date"], np.datetime64(pd.Timestamp(start).date(), "D"))
+        hi = len(table["Date"]) if end is None else np.searchsorted(table["Date"], np.datetime64(pd.Timestamp(end).date(), "D"))
+        return {name: values[lo:hi] for name, values in table.items()}
+
+    def load_frame(self, ticker, start=None, end=None):
+        window = self.get_window(ticker, start, end)
+        if len(window["Date"]) == 0:
+            raise ValueError(f"No data found for ticker {ticker} from {start} to {end}.")
+        return self.to_frame(window)
+
+    def load_many(self, tickers, start=None, end=None):
+        # Tickers are refreshed concurrently, each download waiting on its own ticker lock only
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = executor.map(lambda ticker: self.load_frame(ticker, start, end), tickers)
+            return dict(zip(tickers, frames))
+
+    @staticmethod
+    def to_frame(table):
+        frame = pd.DataFrame({name: np.asarray(values) for name, values in table.items()})
+        frame["Date"] = pd.to_datetime(frame["Date"])
+        return frame
@@ -0,0 +1,71 @@
+import numpy as np
+
+# Monte-Carlo Greeks for European calls and puts under GBM, estimated from the same terminal prices as the option price
+# Pathwise estimators differentiate the discounted payoff along each path (delta, vega, rho), likelihood-ratio
+# estimators weight the payoff by the score of the terminal density (delta, gamma, vega, rho)
+# Sums and sums of squares are accumulated per chunk, so chunked simulations never need all paths at once
+class Greek_Estimator:
+    def __init__(self, spot_price, strike_price, T, risk_free_rate, sigma):
+        self.S = spot_price
+        self.K = strike_price
+        self.T = T
+        self.r = risk_free_rate
+        self.sigma = sigma
+        self.n = 0
+        self.sums = {}
+        self.sq_sums = {}
+
+    def update(self, S_T):
+        S_T = np.asarray(S_T, dtype=float)
+        S, K, T, r, sigma = self.S, self.K, self.T, self.r, self.sigma
+        disc = np.exp(-r * T)
+
+        # Standard normal driving each path, recovered from its terminal price
+        Z = (np.log(S_T / S) - ((r - (0.5 * sigma ** 2)) * T)) / (sigma * np.sqrt(T))
+
+        itm_call = S_T > K
+        itm_put = S_T < K
+        call = np.maximum(S_T - K, 0)
+        put = np.maximum(K - S_T, 0)
+
+        # Scores of the lognormal terminal density with respect to S, sigma and r
+        score_delta = Z / (S * sigma * np.sqrt(T))
+        score_gamma = (((Z ** 2) - 1) / ((S ** 2) * (sigma ** 2) * T)) - (Z / ((S ** 2) * sigma * np.sqrt(T)))
+        score_vega = (((Z ** 2) - 1) / sigma) - (Z * np.sqrt(T))
+        score_rho = (Z * np.sqrt(T) / sigma) - T
+
+        # dS_T/dS = S_T / S and dS_T/dsigma = S_T (W_T - sigma T)
+        dS_dsigma = S_T * ((Z * np.sqrt(T)) - (sigma * T))
+
+        samples = {
+            ('call', 'price'): disc * call,
+            ('call', 'delta_pathwise'): disc * itm_call * S_T / S,
+            ('call', 'vega_pathwise'): disc * itm_call * dS_dsigma,
+            ('call', 'rho_pathwise'): disc * T * ((itm_call * S_T) - call),
+            ('call', 'delta_lr'): disc * call * score_delta,
+            ('call', 'gamma_lr'): disc * call * score_gamma,
+            ('call', 'vega_lr'): disc * call * score_vega,
+            ('call', 'rho_lr'): disc * call * score_rho,
+            ('put', 'price'): disc * put,
+            ('put', 'delta_pathwise'): -disc * itm_put * S_T / S,
+            ('put', 'vega_pathwise'): -disc * itm_put * dS_dsigma,
+            ('put', 'rho_pathwise'): -disc * T * ((itm_put * S_T) + put),
+            ('put', 'delta_lr'): disc * put * score_delta,
+            ('put', 'gamma_lr'): disc * put * score_gamma,
+            ('put', 'vega_lr'): disc * put * score_vega,
+            ('put', 'rho_lr'): disc * put * score_rho,
+        }
+
+        for key, values in samples.items():
+            self.sums[key] = self.sums.get(key, 0) + np.sum(values)
+            self.sq_sums[key] = self.sq_sums.get(key, 0) + np.sum(values ** 2)
+        self.n += len(S_T)
+
+    def results(self):
+        # {'call': {'delta_pathwise': (estimate, standard error), ...}, 'put': {...}}
+        greeks = {'call': {}, 'put': {}}
+        for (contract_type, name), total in self.sums.items():
+            mean = total / self.n
+            variance = max((self.sq_sums[(contract_type, name)] / self.n) - (mean ** 2), 0) * self.n / max(self.n - 1, 1)
+            greeks[contract_type][name] = (mean, np.sqrt(variance / self.n))
+        return greeks
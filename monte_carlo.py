@@ -1,32 +1,85 @@
 import numpy as np
 from opt_pricing import Option_Pricing
+from mc_greeks import Greek_Estimator
+from kernels import get_kernel, as_ndarray
 
 # Implementation of Monte-Carlo simulation for European Options pricing
+# With full_path=False paths are simulated chunk_size at a time and only terminal prices are kept (S_n has one row)
+# Passing a Path_Cache reuses paths from an earlier pricer with the same simulation inputs (any strike)
 class Monte_Carlo_Pricing(Option_Pricing):
-    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, iterations):
-        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a')
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, iterations, dtype=np.float64, memmap_dir=None, full_path=True, chunk_size=None, seed=0, cache=None, backend=None):
+        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a', dtype, memmap_dir)
         self.iter = iterations
+        self.full_path = full_path
+        self.chunk_size = chunk_size if chunk_size is not None else iterations
+        self.seed = seed
+        self.backend = backend
         self.S_n = None
         self.call_price = None
         self.put_price = None
+        self.greek_estimator = None
 
-        self.simulate(days_to_maturity)
+        if cache is None:
+            self.simulate(days_to_maturity)
+        else:
+            key = (self.S, days_to_maturity, self.r, self.sigma, self.iter, self.seed, self.dtype.str, self.full_path, self.chunk_size)
+            self.S_n = cache.get(key)
+
+            if self.S_n is None:
+                self.simulate(days_to_maturity)
+                cache.put(key, self.S_n)
+            else:
+                # Greeks depend on the strike, so they are re-estimated from the cached terminal prices
+                self.greek_estimator = Greek_Estimator(self.S, self.K, self.T, self.r, self.sigma)
+                self.greek_estimator.update(self.S_n[-1])
 
         self.calc_call_price()
         self.calc_put_price()
 
     def simulate(self, days):
         dt = self.T / days
-        np.random.seed(0)
+        np.random.seed(self.seed)
+
+        self.S_n = self.allocate('S_n', (days + 1 if self.full_path else 1, self.iter))
+        self.greek_estimator = Greek_Estimator(self.S, self.K, self.T, self.r, self.sigma)
+
+        drift = (self.r - (0.5 * self.sigma ** 2)) * dt
+        vol = self.sigma * np.sqrt(dt)
+        gbm_paths = get_kernel('gbm_paths', self.backend)
+
+        for start in range(0, self.iter, self.chunk_size):
+            end = min(start + self.chunk_size, self.iter)
+
+            # One (days, paths) block of normals draws the same stream as one row of normals per day
+            Z = np.random.standard_normal((days, end - start))
 
-        self.S_n = np.zeros((days + 1, self.iter))
-        self.S_n[0] = self.S
+            if self.full_path:
+                gbm_paths(as_ndarray(self.S_n)[:, start:end], float(self.S), drift, vol, Z)
+                S_t = np.asarray(self.S_n[-1, start:end], dtype=float)
+            else:
+                S_t = self.S * np.exp(np.sum(drift + (vol * Z), axis=0))
+                self.S_n[0, start:end] = S_t
 
-        for t in range(1, days + 1):
-            self.S_n[t] = self.S_n[t - 1] * np.exp(((self.r - (0.5 * self.sigma ** 2)) * dt) + (self.sigma * np.sqrt(dt) * np.random.standard_normal(self.iter)))
+            # Greeks are accumulated from each chunk's terminal prices, so they cost no extra simulation
+            self.greek_estimator.update(S_t)
 
     def calc_call_price(self):
         self.call_price = np.exp(-self.r * self.T) * (1 / self.iter) * np.sum(np.maximum(self.S_n[-1] - self.K, 0))
 
     def calc_put_price(self):
-        self.put_price = np.exp(-self.r * self.T) * (1 / self.iter) * np.sum(np.maximum(self.K - self.S_n[-1], 0))
\ No newline at end of file
+        self.put_price = np.exp(-self.r * self.T) * (1 / self.iter) * np.sum(np.maximum(self.K - self.S_n[-1], 0))
+
+    def calc_barrier_price(self, barrier, knock='out', contract_type='call'):
+        # Barrier monitored daily on the full paths, an up barrier when it sits above the spot and a down barrier below
+        if not self.full_path:
+            raise ValueError("Barrier pricing needs full_path=True.")
+
+        hits = get_kernel('barrier_hits', self.backend)(as_ndarray(self.S_n), float(barrier), barrier > self.S)
+        alive = ~hits if knock == 'out' else hits
+        payoff = np.maximum(self.S_n[-1] - self.K, 0) if contract_type == 'call' else np.maximum(self.K - self.S_n[-1], 0)
+
+        return np.exp(-self.r * self.T) * np.mean(payoff * alive)
+
+    def calc_greeks(self):
+        # Pathwise and likelihood-ratio Greeks with standard errors, see Greek_Estimator.results
+        return self.greek_estimator.results()
@@ -1,8 +1,18 @@
+import os
+import tempfile
+import weakref
+import numpy as np
 from abc import ABC, abstractmethod
 
+def remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 # Abstract class to price call and put options
 class Option_Pricing(ABC):
-    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, dividends, sigma, contract_type):
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, dividends, sigma, contract_type, dtype=np.float64, memmap_dir=None):
         self.S = spot_price
         self.K = strike_price
         self.T = days_to_maturity / 365
@@ -12,12 +22,41 @@ class Option_Pricing(ABC):
         
         self.contract_type = contract_type.lower()
         self.price = 0
+
+        # Storage for large path/lattice arrays: element type and optional directory for memory-mapped backing files
+        self.dtype = np.dtype(dtype)
+        self.memmap_dir = memmap_dir
         super().__init__()
 
+    # Allocates a zeroed array, backed by a file in memmap_dir when set so oversized arrays live on disk instead of RAM
+    # The backing file is scratch space owned by the array: it is deleted once the array (and every view of it) is
+    # garbage collected, or at interpreter exit at the latest
+    def allocate(self, name, shape):
+        if self.memmap_dir is None:
+            return np.zeros(shape, dtype=self.dtype)
+
+        os.makedirs(self.memmap_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix=f"{name}_", suffix=".dat", dir=self.memmap_dir)
+        os.close(fd)
+        array = np.memmap(path, dtype=self.dtype, mode='w+', shape=shape)
+        weakref.finalize(array, remove_file, path)
+        return array
+
     @abstractmethod
     def calc_call_price(self):
         pass
 
     @abstractmethod
     def calc_put_price(self):
-        pass
\ No newline at end of file
+        pass
+
+# Prices the same inputs with float64 and a reduced-precision dtype and returns the absolute price differences,
+# e.g. precision_error(Binomial_Pricing, 100, 110, 365, 0.05, 0.25, 500) before switching a workload to float32
+def precision_error(model_class, *args, dtype=np.float32, **kwargs):
+    reference = model_class(*args, dtype=np.float64, **kwargs)
+    reduced = model_class(*args, dtype=dtype, **kwargs)
+
+    return {
+        "call": abs(float(reduced.call_price) - float(reference.call_price)),
+        "put": abs(float(reduced.put_price) - float(reference.put_price)),
+    }
@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+
+# Size-bounded LRU cache of simulated price paths keyed by the simulation inputs
+# Pricers that share spot, rate, vol, days, path count and seed reuse one simulation (common random numbers),
+# so strikes, payoffs and risk measures can vary without regenerating normals and paths
+class Path_Cache:
+    def __init__(self, max_bytes=512 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            paths = self.entries.get(key)
+            if paths is None:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return paths
+
+    def put(self, key, paths):
+        # Arrays larger than the whole budget are not cached, everything else evicts least recently used entries
+        if paths.nbytes > self.max_bytes:
+            return
+
+        # Cached paths are shared between pricers, so they are made read-only
+        paths.flags.writeable = False
+
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.entries.pop(key).nbytes
+
+            while self.entries and self.nbytes + paths.nbytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+
+            self.entries[key] = paths
+            self.nbytes += paths.nbytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def calc_stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "Entries": len(self.entries),
+                "Memory (MB)": self.nbytes / 2 ** 20,
+                "Limit (MB)": self.max_bytes / 2 ** 20,
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "Hit Rate": self.hits / lookups if lookups else 0.0,
+                "Evictions": self.evictions,
+            }
@@ -0,0 +1,142 @@
+import time
+import asyncio
+import numpy as np
+
+from black_scholes import Black_Scholes_Pricing
+
+# Local stand-in for a live underlying feed: GBM ticks (timestamp, spot, sigma) pushed onto an asyncio queue
+class Simulated_Feed:
+    def __init__(self, spot_price, sigma, n_ticks=1000, tick_interval=0.001, ticks_per_year=252 * 6.5 * 3600, seed=0):
+        self.S = spot_price
+        self.sigma = sigma
+        self.n_ticks = n_ticks
+        self.tick_interval = tick_interval
+        self.dt = 1 / ticks_per_year
+        self.rng = np.random.default_rng(seed)
+
+    async def run(self, queue):
+        spot = self.S
+        for _ in range(self.n_ticks):
+            spot *= np.exp((-0.5 * self.sigma ** 2 * self.dt) + (self.sigma * np.sqrt(self.dt) * self.rng.standard_normal()))
+            await queue.put((time.perf_counter(), spot, self.sigma))
+            await asyncio.sleep(self.tick_interval)
+
+        # End-of-feed marker
+        await queue.put(None)
+
+# Book of European option positions on one underlying, repriced as arrays with Black_Scholes_Pricing
+class Option_Book:
+    def __init__(self, strike_prices, days_to_maturity, contract_types, quantities, risk_free_rate, dividends):
+        self.K = np.asarray(strike_prices, dtype=float)
+        self.days = np.asarray(days_to_maturity, dtype=float)
+        self.contract_types = np.asarray([contract_type.lower() for contract_type in contract_types])
+        self.quantities = np.asarray(quantities, dtype=float)
+        self.r = risk_free_rate
+        self.q = dividends
+
+    def full_reprice(self, spot_price, sigma):
+        # Returns per-position (price, delta, gamma, vega) arrays, one vectorized pricer per contract type
+        price, delta, gamma, vega = (np.zeros(len(self.K)) for _ in range(4))
+        for contract_type in ('call', 'put'):
+            mask = self.contract_types == contract_type
+            if mask.any():
+                option = Black_Scholes_Pricing(spot_price, self.K[mask], self.days[mask], self.r, self.q, sigma, contract_type)
+                price[mask] = option.price
+                delta[mask] = option.calc_delta()
+                gamma[mask] = option.calc_gamma()
+                vega[mask] = option.calc_vega()
+        return price, delta, gamma, vega
+
+# Event-driven repricer: small moves are handled with a delta-gamma-vega expansion around the last full reprice,
+# and a full vectorized reprice runs when the spot or vol move crosses its threshold or the time budget runs out
+class Streaming_Repricer:
+    def __init__(self, book, move_threshold=0.005, vol_threshold=0.01, time_budget=1.0):
+        self.book = book
+        self.move_threshold = move_threshold
+        self.vol_threshold = vol_threshold
+        self.time_budget = time_budget
+
+        self.ref_spot = None
+        self.ref_sigma = None
+        self.ref_time = None
+        self.ref_greeks = None
+        self.spot = None
+        self.sigma = None
+        self.prices = None
+
+        self.latencies = []
+        self.processing_times = []
+        self.backlogs = []
+        self.full_reprices = 0
+        self.approx_reprices = 0
+
+    def reprice(self, spot_price, sigma):
+        self.ref_spot = spot_price
+        self.ref_sigma = sigma
+        self.ref_time = time.perf_counter()
+        price, delta, gamma, vega = self.book.full_reprice(spot_price, sigma)
+        self.ref_greeks = (price, delta, gamma, vega)
+        self.prices = price
+        self.full_reprices += 1
+
+    def on_tick(self, spot_price, sigma):
+        self.spot = spot_price
+        self.sigma = sigma
+
+        if self.ref_spot is None:
+            self.reprice(spot_price, sigma)
+            return self.prices
+
+        move = abs(spot_price / self.ref_spot - 1)
+        vol_move = abs(sigma - self.ref_sigma)
+        stale = time.perf_counter() - self.ref_time > self.time_budget
+
+        if move > self.move_threshold or vol_move > self.vol_threshold or stale:
+            self.reprice(spot_price, sigma)
+        else:
+            price, delta, gamma, vega = self.ref_greeks
+            dS = spot_price - self.ref_spot
+            self.prices = price + (delta * dS) + (0.5 * gamma * dS ** 2) + (vega * (sigma - self.ref_sigma))
+            self.approx_reprices += 1
+
+        return self.prices
+
+    def calc_book_value(self):
+        return np.sum(self.book.quantities * self.prices)
+
+    async def run(self, feed):
+        queue = asyncio.Queue()
+        producer = asyncio.create_task(feed.run(queue))
+
+        while True:
+            tick = await queue.get()
+            if tick is None:
+                break
+
+            # Backlog is the number of ticks still waiting when this one is picked up
+            self.backlogs.append(queue.qsize())
+            timestamp, spot_price, sigma = tick
+
+            start = time.perf_counter()
+            self.on_tick(spot_price, sigma)
+            end = time.perf_counter()
+
+            self.processing_times.append(end - start)
+            self.latencies.append(end - timestamp)
+
+        await producer
+
+    def calc_metrics(self):
+        latencies = np.array(self.latencies) * 1e6
+        processing = np.array(self.processing_times) * 1e6
+        return {
+            "Ticks": len(self.latencies),
+            "Full Reprices": self.full_reprices,
+            "Approximate Reprices": self.approx_reprices,
+            "Tick-to-Price p50 (µs)": np.percentile(latencies, 50),
+            "Tick-to-Price p99 (µs)": np.percentile(latencies, 99),
+            "Processing p50 (µs)": np.percentile(processing, 50),
+            "Processing p99 (µs)": np.percentile(processing, 99),
+            "Max Backlog": max(self.backlogs),
+            "Mean Backlog": np.mean(self.backlogs),
+        }
@@ -0,0 +1,48 @@
+import time
+import numpy as np
+
+from black_scholes import Black_Scholes_Pricing, black_scholes_fast
+
+# Script used to check the scalar fast path against the class and compare per-quote latency (price and all Greeks)
+# python -m test_scripts.bench_black_scholes
+S = 100
+K = 110
+days = 180
+r = 0.05
+q = 0.01
+sigma = 0.25
+quotes = 20000
+
+def class_quote(contract_type):
+    option = Black_Scholes_Pricing(S, K, days, r, q, sigma, contract_type)
+    return option.price, option.calc_delta(), option.calc_gamma(), option.calc_theta(), option.calc_vega(), option.calc_rho()
+
+def fast_quote(contract_type):
+    return black_scholes_fast(S, K, days, r, q, sigma, contract_type)
+
+# Independent check of the dividend-adjusted Greeks: central finite differences of the price
+# (theta is the price change per year of calendar time, i.e. minus the derivative in time to maturity)
+def price(contract_type, S=S, days=days, r=r, sigma=sigma):
+    return Black_Scholes_Pricing(S, K, days, r, q, sigma, contract_type).price
+
+h = 1e-4
+for contract_type in ["call", "put"]:
+    delta = (price(contract_type, S=S + h) - price(contract_type, S=S - h)) / (2 * h)
+    gamma = (price(contract_type, S=S + 1e-2) - (2 * price(contract_type)) + price(contract_type, S=S - 1e-2)) / 1e-4
+    theta = -(price(contract_type, days=days + (h * 365)) - price(contract_type, days=days - (h * 365))) / (2 * h)
+    vega = (price(contract_type, sigma=sigma + h) - price(contract_type, sigma=sigma - h)) / (2 * h)
+    rho = (price(contract_type, r=r + h) - price(contract_type, r=r - h)) / (2 * h)
+    expected = (price(contract_type), delta, gamma, theta, vega, rho)
+
+    assert np.allclose(class_quote(contract_type), expected, rtol=1e-5, atol=1e-7), contract_type
+    assert np.allclose(fast_quote(contract_type), class_quote(contract_type), rtol=1e-12, atol=1e-12), contract_type
+
+# Per-quote latency distribution, one contract priced per call as in the quoting loop
+for name, quote in [("Black_Scholes_Pricing", class_quote), ("black_scholes_fast", fast_quote)]:
+    latencies = np.empty(quotes)
+    for i in range(quotes):
+        start = time.perf_counter_ns()
+        quote("call")
+        latencies[i] = time.perf_counter_ns() - start
+
+    print(f"{name}: p50 {np.percentile(latencies, 50) / 1e3:.2f} µs, p99 {np.percentile(latencies, 99) / 1e3:.2f} µs")
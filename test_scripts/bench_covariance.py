@@ -0,0 +1,67 @@
+import time
+import numpy as np
+import pandas as pd
+
+from covariance import Rolling_Covariance, EWMA_Covariance
+
+# Script used to check the incremental covariance engines against full recomputation and to compare their speed
+# python -m test_scripts.bench_covariance
+rng = np.random.default_rng(0)
+bars, tickers, window, lam = 600, 40, 120, 0.94
+mixing = rng.standard_normal((tickers, tickers)) * 0.01
+returns = (rng.standard_normal((bars, tickers)) @ mixing.T) + 0.0005
+
+# Correctness: backfill half the history, update through the rest, compare with recomputation on the full history
+rolling = Rolling_Covariance(window).compute(returns[:bars // 2])
+ewma = EWMA_Covariance(lam).compute(returns[:bars // 2])
+shrunk = Rolling_Covariance(window, shrinkage='ledoit_wolf').compute(returns[:bars // 2])
+for x in returns[bars // 2:]:
+    rolling.update(x)
+    ewma.update(x)
+    shrunk.update(x)
+
+expected = pd.DataFrame(returns).rolling(window).cov().iloc[-tickers:].values
+assert np.allclose(rolling.calc_covariance(), expected, rtol=1e-10, atol=0)
+assert np.allclose(rolling.calc_correlation(), np.corrcoef(returns[-window:].T), rtol=1e-10, atol=1e-12)
+
+weights = lam ** np.arange(bars - 1, -1, -1)
+assert np.allclose(ewma.calc_covariance(), (returns * weights[:, None]).T @ returns / np.sum(weights), rtol=1e-10, atol=0)
+
+# Ledoit-Wolf on the centred window (sklearn.covariance.ledoit_wolf)
+X = returns[-window:] - returns[-window:].mean(axis=0)
+emp_cov = X.T @ X / window
+mu = np.trace(emp_cov) / tickers
+beta = (np.sum((X ** 2).T @ (X ** 2)) / window - np.sum(emp_cov ** 2)) / (tickers * window)
+delta = (np.sum(emp_cov ** 2) - (2 * mu * np.trace(emp_cov)) + (tickers * mu ** 2)) / tickers
+shrinkage = min(beta, delta) / delta
+assert np.isclose(shrunk.calc_shrinkage(), shrinkage, rtol=1e-10)
+# Same intensity, applied to the ddof=1 window covariance so it is sklearn's matrix scaled by window / (window - 1)
+sklearn_cov = ((1 - shrinkage) * emp_cov) + (shrinkage * mu * np.eye(tickers))
+assert np.allclose(shrunk.calc_covariance(), sklearn_cov * window / (window - 1), rtol=1e-10, atol=0)
+
+# A zero intensity reproduces the unshrunk covariance, and a partly filled window is NaN with or without shrinkage
+assert np.allclose(Rolling_Covariance(window, shrinkage=0.0).compute(returns).calc_covariance(), rolling.calc_covariance(), rtol=1e-12, atol=0)
+assert np.isnan(Rolling_Covariance(window).compute(returns[:window // 2]).calc_covariance()).all()
+assert np.isnan(Rolling_Covariance(window, shrinkage='ledoit_wolf').compute(returns[:window // 2]).calc_covariance()).all()
+assert np.isnan(Rolling_Covariance(window, shrinkage=0.5).compute(returns[:window // 2]).calc_covariance()).all()
+
+L = shrunk.calc_cholesky()
+assert np.allclose(L @ L.T, shrunk.calc_covariance(), rtol=1e-10, atol=1e-18)
+print(f"Checked {tickers} tickers, Ledoit-Wolf shrinkage {shrinkage:.3f}")
+
+# Benchmark: per-bar update against recomputing the window from scratch
+for tickers in (100, 500):
+    returns = rng.standard_normal((window + 50, tickers)) * 0.01
+    engine = Rolling_Covariance(window).compute(returns[:window])
+
+    start = time.perf_counter()
+    for x in returns[window:]:
+        engine.update(x).calc_covariance()
+    update_time = (time.perf_counter() - start) / 50
+
+    start = time.perf_counter()
+    for end in range(window + 1, window + 51):
+        np.cov(returns[end - window:end].T)
+    recompute_time = (time.perf_counter() - start) / 50
+
+    print(f"{tickers} tickers, window {window}: update {update_time * 1e3:.2f} ms, recompute {recompute_time * 1e3:.2f} ms")
@@ -0,0 +1,47 @@
+import time
+import numpy as np
+
+from black_scholes import Black_Scholes_Pricing
+from fourier import Fourier_Pricing
+
+# Script used to validate the Fourier pricers against Black-Scholes and compare strike-chain throughput
+# python -m test_scripts.bench_fourier
+S = 100
+days = 180
+r = 0.05
+q = 0.01
+sigma = 0.25
+strikes = np.linspace(50, 150, 500)
+repeats = 5
+
+start = time.perf_counter()
+for _ in range(repeats):
+    bs_calls = np.array([Black_Scholes_Pricing(S, K, days, r, q, sigma, "call").price for K in strikes])
+bs_time = (time.perf_counter() - start) / repeats
+
+for method in ["fft", "cos"]:
+    N = 4096 if method == "fft" else 256
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        chain = Fourier_Pricing(S, strikes, days, r, q, sigma, method=method, N=N)
+    chain_time = (time.perf_counter() - start) / repeats
+
+    print(f"{method.upper()} max abs error vs Black-Scholes: {np.max(np.abs(chain.call_price - bs_calls)):.2e}")
+    print(f"{method.upper()} chain of {len(strikes)} strikes: {chain_time * 1e3:.2f} ms ({len(strikes) / chain_time:,.0f} strikes/s)")
+
+print(f"Per-strike Black-Scholes: {bs_time * 1e3:.2f} ms ({len(strikes) / bs_time:,.0f} strikes/s)")
+
+# Correctness: short expiries and wing strikes far outside +- a few standard deviations of the spot
+for days, chain in [(2, [60, 95, 100, 105, 200]), (7, [50, 80, 100, 150, 300]), (30, np.linspace(20, 400, 200)), (180, strikes)]:
+    bs_calls = np.array([Black_Scholes_Pricing(S, K, days, r, q, sigma, "call").price for K in chain])
+    bs_puts = np.array([Black_Scholes_Pricing(S, K, days, r, q, sigma, "put").price for K in chain])
+
+    # FFT prices are linearly interpolated on its log-strike grid, which costs a few 1e-3 near the money at short expiries
+    for method, N, tol in [("fft", 4096, 5e-3), ("cos", 256, 1e-8)]:
+        prices = Fourier_Pricing(S, chain, days, r, q, sigma, method=method, N=N)
+        assert np.allclose(prices.call_price, bs_calls, rtol=0, atol=tol), (method, days)
+        assert np.allclose(prices.put_price, bs_puts, rtol=0, atol=tol), (method, days)
+
+print("Short-expiry and wing-strike chains match Black-Scholes")
+
@@ -0,0 +1,73 @@
+import time
+import numpy as np
+
+from black_scholes import Black_Scholes_Pricing
+from binomial import Binomial_Pricing
+from trinomial import Trinomial_Pricing
+from monte_carlo import Monte_Carlo_Pricing
+from kernels import BACKENDS
+
+# Script used to check that every kernel backend prices identically and to compare their speed
+# python -m test_scripts.bench_kernels
+S = 100
+K = 110
+days = 365
+r = 0.05
+sigma = 0.25
+
+bs_call = Black_Scholes_Pricing(S, K, days, r, 0, sigma, "call").price
+bs_put = Black_Scholes_Pricing(S, K, days, r, 0, sigma, "put").price
+
+# Correctness: European lattices converge to Black-Scholes, backends agree on American prices, boundaries and paths
+results = {}
+for backend in BACKENDS:
+    binomial = Binomial_Pricing(S, K, days, r, sigma, 400, backend=backend)
+    trinomial = Trinomial_Pricing(S, K, days, r, sigma, 200, backend=backend)
+    assert abs(binomial.call_price - bs_call) < 0.02 and abs(binomial.put_price - bs_put) < 0.02, backend
+    assert abs(trinomial.call_price - bs_call) < 0.02 and abs(trinomial.put_price - bs_put) < 0.02, backend
+
+    american = Binomial_Pricing(S, K, days, r, sigma, 400, american=True, backend=backend)
+    american_tri = Trinomial_Pricing(S, K, days, r, sigma, 200, american=True, backend=backend)
+    assert american.put_price > bs_put and abs(american.put_price - american_tri.put_price) < 0.02, backend
+    assert abs(american.call_price - binomial.call_price) < 1e-10, backend
+
+    # Compact lattices (single level buffer, or every level packed) price the same trees as the dense ones
+    for keep_values in (False, True):
+        compact = Binomial_Pricing(S, K, days, r, sigma, 400, american=True, backend=backend, compact=True, keep_values=keep_values)
+        compact_tri = Trinomial_Pricing(S, K, days, r, sigma, 200, american=True, backend=backend, compact=True, keep_values=keep_values)
+        assert abs(compact.put_price - american.put_price) < 1e-10 and abs(compact_tri.put_price - american_tri.put_price) < 1e-10, backend
+        assert np.allclose(compact.put_boundary, american.put_boundary, equal_nan=True), backend
+        assert np.allclose(compact_tri.put_boundary, american_tri.put_boundary, equal_nan=True), backend
+
+    mc = Monte_Carlo_Pricing(S, K, days, r, sigma, 2000, backend=backend)
+    results[backend] = (american.put_price, american.put_boundary, mc.S_n[-1], mc.calc_barrier_price(130))
+
+for backend in BACKENDS[1:]:
+    assert np.isclose(results[backend][0], results[BACKENDS[0]][0], rtol=1e-12, atol=0)
+    assert np.allclose(results[backend][1], results[BACKENDS[0]][1], equal_nan=True)
+    assert np.allclose(results[backend][2], results[BACKENDS[0]][2], rtol=1e-10)
+    assert np.isclose(results[backend][3], results[BACKENDS[0]][3], rtol=1e-10)
+
+print(f"Backends checked: {BACKENDS}")
+
+# Benchmark: best of three runs per backend, after a warm-up run so JIT compilation is not timed
+def best_time(fn, repeats=3):
+    fn()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+cases = {
+    "Binomial American (2000 steps)": lambda backend: Binomial_Pricing(S, K, days, r, sigma, 2000, american=True, backend=backend),
+    "Trinomial American (1000 steps)": lambda backend: Trinomial_Pricing(S, K, days, r, sigma, 1000, american=True, backend=backend),
+    "Binomial American compact (2000 steps)": lambda backend: Binomial_Pricing(S, K, days, r, sigma, 2000, american=True, backend=backend, compact=True),
+    "Trinomial American compact (1000 steps)": lambda backend: Trinomial_Pricing(S, K, days, r, sigma, 1000, american=True, backend=backend, compact=True),
+    "Monte-Carlo + barrier (20k paths)": lambda backend: Monte_Carlo_Pricing(S, K, days, r, sigma, 20000, backend=backend).calc_barrier_price(130),
+}
+
+for name, case in cases.items():
+    timings = ", ".join(f"{backend}: {best_time(lambda: case(backend)) * 1e3:.1f} ms" for backend in BACKENDS)
+    print(f"{name}: {timings}")
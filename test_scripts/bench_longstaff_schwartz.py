@@ -0,0 +1,27 @@
+import time
+
+from binomial import Binomial_Pricing
+from trinomial import Trinomial_Pricing
+from longstaff_schwartz import Longstaff_Schwartz_Pricing, BASES
+
+# Script used to check Longstaff-Schwartz American prices against the American lattices
+# python -m test_scripts.bench_longstaff_schwartz
+K = 110
+days = 365
+r = 0.05
+sigma = 0.25
+
+for S in (80, 100, 120):
+    binomial = Binomial_Pricing(S, K, days, r, sigma, 1000, american=True)
+    trinomial = Trinomial_Pricing(S, K, days, r, sigma, 500, american=True)
+
+    for basis in BASES:
+        start = time.perf_counter()
+        lsm = Longstaff_Schwartz_Pricing(S, K, days, r, sigma, 100000, exercise_dates=50, basis=basis)
+        elapsed = time.perf_counter() - start
+
+        # LSM is biased low by its estimated (suboptimal) exercise rule, so allow a small margin beyond sampling error
+        assert abs(lsm.put_price - binomial.put_price) < (3 * lsm.put_se) + 0.05, (S, basis)
+        assert abs(lsm.call_price - binomial.call_price) < (3 * lsm.call_se) + 0.05, (S, basis)
+        print(f"S={S} {basis}: put {lsm.put_price:.4f} ± {lsm.put_se:.4f} (binomial {binomial.put_price:.4f}, trinomial {trinomial.put_price:.4f}), "
+              f"call {lsm.call_price:.4f} ± {lsm.call_se:.4f} (binomial {binomial.call_price:.4f}), {elapsed:.2f} s")
@@ -1,18 +1,12 @@
-import pandas as pd
-import numpy as np
-import yfinance as yf
 import datetime as dt
 import plotly.graph_objects as go
-from pykalman import KalmanFilter
+
+from indicators import Kalman_Filter, Simple_Moving_Average, Exponential_Moving_Average
+from market_data import Market_Data_Store
 
 # Function to fetch data from earliest available date to current date
 def load_data_full(ticker):
-    data = yf.download(ticker, period="max")
-    if data.empty:
-        raise ValueError(f"No data found for ticker {ticker}.")
-    data.reset_index(inplace=True)
-    data['Date'] = pd.to_datetime(data['Date'])
-    return data
+    return Market_Data_Store(".market_data").load_frame(ticker)
 
 # Get ticker data
 ticker = "AAPL"
@@ -20,22 +14,19 @@ data_full = load_data_full(ticker)
 
 # Generate Simple Moving Average
 sma_days = 30
-data_full['SMA'] = data_full['Adj Close'].rolling(window=sma_days).mean()
+data_full['SMA'] = Simple_Moving_Average(sma_days).compute(data_full['Adj Close'].values)
 
 # Generate Exponential Moving Average
 ema_days = 30
-data_full['EMA'] = data_full['Adj Close'].ewm(span=ema_days, adjust=False).mean()
+data_full['EMA'] = Exponential_Moving_Average(ema_days).compute(data_full['Adj Close'].values)
 
 # Generate Kalman Filter Time Series
-kf = KalmanFilter(transition_matrices = [1],
-              observation_matrices = [1],
-              initial_state_mean = 0,
-              initial_state_covariance = 1,
-              observation_covariance=1,
-              transition_covariance=.0001)
-
-kf_mean, kf_cov = kf.filter(data_full['Adj Close'].values)
-data_full['Kalman'] = kf_mean.flatten()
+kf = Kalman_Filter(transition_covariance=.0001,
+                   observation_covariance=1,
+                   initial_state_mean=0,
+                   initial_state_covariance=1)
+
+data_full['Kalman'] = kf.filter(data_full['Adj Close'].values)
 
 # Create and display figure
 fig = go.Figure()
@@ -1,13 +1,22 @@
 import numpy as np
 from opt_pricing import Option_Pricing
+from kernels import get_kernel, as_ndarray
+from lattice import Trinomial_Lattice, Packed_Lattice, trinomial_widths
 
 class Trinomial_Pricing(Option_Pricing):
-    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, steps):
-        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a')
+    def __init__(self, spot_price, strike_price, days_to_maturity, risk_free_rate, sigma, steps, dtype=np.float64, memmap_dir=None, american=False, backend=None, compact=False, keep_values=False):
+        super().__init__(spot_price, strike_price, days_to_maturity, risk_free_rate, 0, sigma, 'n/a', dtype, memmap_dir)
         self.steps = steps
+        self.american = american
+        self.backend = backend
+        self.compact = compact
+        self.keep_values = keep_values
         self.ST = None
+        self.lattice = None
         self.call_price = None
         self.put_price = None
+        self.call_boundary = None
+        self.put_boundary = None
 
         self.generate()
 
@@ -17,56 +26,52 @@ class Trinomial_Pricing(Option_Pricing):
     def generate(self):
         dt = self.T / self.steps
         u = np.exp(self.sigma * np.sqrt(2 * dt))
-        d = 1 / u
-        m = 1 
 
         pu = ((np.exp((self.r) * dt / 2) - np.exp(-self.sigma * np.sqrt(dt / 2))) / (np.exp(self.sigma * np.sqrt(dt / 2)) - np.exp(-self.sigma * np.sqrt(dt / 2)))) ** 2
         pd = ((np.exp(self.sigma * np.sqrt(dt / 2)) - np.exp((self.r) * dt / 2)) / (np.exp(self.sigma * np.sqrt(dt / 2)) - np.exp(-self.sigma * np.sqrt(dt / 2)))) ** 2
         pm = 1 - pu - pd 
 
-        # Initialize asset prices at maturity
-        self.ST = np.zeros((2 * self.steps + 1, self.steps + 1))
-        self.ST[self.steps, 0] = self.S
-
-        for i in range(1, self.steps + 1):
-            for j in range(2 * i + 1):
-                if j == 0:
-                    self.ST[self.steps - i + j, i] = self.ST[self.steps - i + j + 1, i - 1] * d
-                elif j == 2 * i:
-                    self.ST[self.steps - i + j, i] = self.ST[self.steps - i + j - 1, i - 1] * u
-                else:
-                    self.ST[self.steps - i + j, i] = self.ST[self.steps - i + j, i - 1] * m
-
-        # Initialize option values at maturity
-        self.call_option_values = np.zeros((2 * self.steps + 1, self.steps + 1))
-        self.put_option_values = np.zeros((2 * self.steps + 1, self.steps + 1))
-
-        self.call_option_values[:, -1] = np.maximum(0, self.ST[:, -1] - self.K)
-        self.put_option_values[:, -1] = np.maximum(0, self.K - self.ST[:, -1])
-
-        # Step back through the tree
-        for i in range(self.steps - 1, -1, -1):
-            for j in range(2 * i + 1):
-                call_value = 0
-                put_value = 0
-
-                if self.steps - i + j - 1 >= 0 and self.steps - i + j - 1 < 2 * self.steps + 1:
-                    call_value += pu * self.call_option_values[self.steps - i + j - 1, i + 1]
-                    put_value += pu * self.put_option_values[self.steps - i + j - 1, i + 1]
-
-                if self.steps - i + j < 2 * self.steps + 1:
-                    call_value += pm * self.call_option_values[self.steps - i + j, i + 1]
-                    put_value += pm * self.put_option_values[self.steps - i + j, i + 1]
-
-                if self.steps - i + j + 1 < 2 * self.steps + 1:
-                    call_value += pd * self.call_option_values[self.steps - i + j + 1, i + 1]
-                    put_value += pd * self.put_option_values[self.steps - i + j + 1, i + 1]
-
-                self.call_option_values[self.steps - i + j, i] = np.exp(-self.r * dt) * call_value
-                self.put_option_values[self.steps - i + j, i] = np.exp(-self.r * dt) * put_value
+        # Node spots on demand, plus the dense ST matrix unless compact is set
+        self.lattice = Trinomial_Lattice(self.S, u, self.steps)
+
+        # Early-exercise boundary per step (American only), NaN where exercise is never optimal
+        self.call_boundary = np.full(self.steps + 1, np.nan)
+        self.put_boundary = np.full(self.steps + 1, np.nan)
+
+        if self.compact:
+            # No stored spots, and the values roll back through one level buffer per contract type (O(steps) memory),
+            # unless keep_values asks for every level in packed layout
+            if self.keep_values:
+                widths = trinomial_widths(self.steps)
+                self.call_option_values = Packed_Lattice(self.allocate('call_option_values', widths.sum()), widths)
+                self.put_option_values = Packed_Lattice(self.allocate('put_option_values', widths.sum()), widths)
+                call_values, put_values, offsets = self.call_option_values.values, self.put_option_values.values, self.call_option_values.offsets
+            else:
+                call_values = self.call_option_values = self.allocate('call_option_values', (2 * self.steps) + 1)
+                put_values = self.put_option_values = self.allocate('put_option_values', (2 * self.steps) + 1)
+                offsets = np.zeros(self.steps + 1, dtype=np.int64)
+
+            lattice = get_kernel('trinomial_packed', self.backend)
+            lattice(as_ndarray(call_values), as_ndarray(put_values), offsets, float(self.S), float(self.K), u, pu, pm, pd, np.exp(-self.r * dt), self.american, self.call_boundary, self.put_boundary)
+            return
+
+        # Row steps + k holds the node S * u^k, so pu weights the row above and pd the row below
+        self.ST = self.allocate('ST', (2 * self.steps + 1, self.steps + 1))
+        self.call_option_values = self.allocate('call_option_values', (2 * self.steps + 1, self.steps + 1))
+        self.put_option_values = self.allocate('put_option_values', (2 * self.steps + 1, self.steps + 1))
+
+        # Build the tree and step back through it with the Numba kernel when available, NumPy otherwise
+        lattice = get_kernel('trinomial_lattice', self.backend)
+        lattice(as_ndarray(self.ST), as_ndarray(self.call_option_values), as_ndarray(self.put_option_values), float(self.S), float(self.K), u, pu, pm, pd, np.exp(-self.r * dt), self.american, self.call_boundary, self.put_boundary)
 
     def calc_call_price(self):
-        self.call_price = self.call_option_values[self.steps, 0]
+        if not self.compact:
+            self.call_price = self.call_option_values[self.steps, 0]
+        else:
+            self.call_price = self.call_option_values.node(0, 0) if self.keep_values else self.call_option_values[0]
 
     def calc_put_price(self):
-        self.put_price = self.put_option_values[self.steps, 0]
+        if not self.compact:
+            self.put_price = self.put_option_values[self.steps, 0]
+        else:
+            self.put_price = self.put_option_values.node(0, 0) if self.keep_values else self.put_option_values[0]
@@ -0,0 +1,124 @@
+import numpy as np
+
+# Implied volatility surface built from (strike, days to maturity, vol) quotes
+# Interpolation runs in total variance w = sigma ** 2 * T: piecewise linear in log-strike within an expiry,
+# linear in T across expiries, with w forced non-decreasing in T so the surface is free of calendar arbitrage
+# get_vol returns sigma values that can be passed straight into the pricers' sigma argument
+class Volatility_Surface:
+    def __init__(self, strikes, days_to_maturity, vols):
+        self.quotes = {}
+        self.days = None
+        self.T = None
+        self.log_strikes = None
+        self.w_raw = None
+        self.w = None
+        self.slopes = None
+
+        self.add_quotes(strikes, days_to_maturity, vols)
+        self.build()
+
+    def add_quotes(self, strikes, days_to_maturity, vols):
+        strikes, days_to_maturity, vols = np.broadcast_arrays(np.asarray(strikes, dtype=float), np.asarray(days_to_maturity), np.asarray(vols, dtype=float))
+        for K, days, vol in zip(strikes.ravel(), days_to_maturity.ravel(), vols.ravel()):
+            if K <= 0 or days <= 0 or vol <= 0:
+                raise ValueError(f"Invalid quote (K={K}, days={days}, vol={vol}): all values must be positive.")
+            self.quotes.setdefault(int(days), {})[float(K)] = float(vol)
+
+    def build(self):
+        self.days = np.array(sorted(self.quotes))
+        self.T = self.days / 365
+        self.log_strikes = np.log(np.array(sorted({K for slice_quotes in self.quotes.values() for K in slice_quotes})))
+
+        self.w_raw = np.vstack([self.slice_variance(days, self.log_strikes) for days in self.days])
+        self.w = np.empty_like(self.w_raw)
+        self.slopes = np.empty((len(self.days), max(len(self.log_strikes) - 1, 1)))
+        self.refresh_rows(0)
+
+    def slice_variance(self, days, log_strikes):
+        # Total variance of a single expiry's quotes, linear in log-strike with flat extrapolation
+        slice_strikes = np.array(sorted(self.quotes[days]))
+        slice_vols = np.array([self.quotes[days][K] for K in slice_strikes])
+        return np.interp(log_strikes, np.log(slice_strikes), (slice_vols ** 2) * (days / 365))
+
+    def refresh_rows(self, first_row):
+        # Re-applies the calendar constraint and recomputes interpolation coefficients from first_row onwards
+        for i in range(first_row, len(self.days)):
+            self.w[i] = self.w_raw[i] if i == 0 else np.maximum(self.w_raw[i], self.w[i - 1])
+
+        if len(self.log_strikes) > 1:
+            self.slopes[first_row:] = np.diff(self.w[first_row:], axis=1) / np.diff(self.log_strikes)
+        else:
+            self.slopes[first_row:] = 0
+
+    def update_quotes(self, strikes, days_to_maturity, vols):
+        # Folds new or revised quotes into the surface, touching only the affected expiries and strike columns
+        old_days = set(self.quotes)
+        old_log_strikes = self.log_strikes
+        self.add_quotes(strikes, days_to_maturity, vols)
+
+        new_log_strikes = np.log(np.array(sorted({K for slice_quotes in self.quotes.values() for K in slice_quotes})))
+        if len(new_log_strikes) != len(old_log_strikes):
+            # New strike columns need every existing slice evaluated there, but only at the new columns
+            positions = np.searchsorted(new_log_strikes, old_log_strikes)
+            w_raw = np.empty((len(self.days), len(new_log_strikes)))
+            w_raw[:, positions] = self.w_raw
+            added = np.setdiff1d(np.arange(len(new_log_strikes)), positions)
+            for i, days in enumerate(self.days):
+                w_raw[i, added] = self.slice_variance(days, new_log_strikes[added])
+
+            self.log_strikes = new_log_strikes
+            self.w_raw = w_raw
+            self.w = np.empty_like(w_raw)
+            self.slopes = np.empty((len(self.days), max(len(new_log_strikes) - 1, 1)))
+            first_row = 0
+        else:
+            first_row = len(self.days)
+
+        for days in sorted(set(np.atleast_1d(days_to_maturity).astype(int).ravel())):
+            if days not in old_days:
+                row = np.searchsorted(self.days, days)
+                self.days = np.insert(self.days, row, days)
+                self.T = self.days / 365
+                self.w_raw = np.insert(self.w_raw, row, 0, axis=0)
+                self.w = np.insert(self.w, row, 0, axis=0)
+                self.slopes = np.insert(self.slopes, row, 0, axis=0)
+                old_days.add(days)
+            else:
+                row = np.searchsorted(self.days, days)
+
+            self.w_raw[row] = self.slice_variance(days, self.log_strikes)
+            first_row = min(first_row, row)
+
+        if first_row < len(self.days):
+            self.refresh_rows(first_row)
+
+    def row_variance(self, rows, x):
+        # Total variance on expiry rows at log-strikes x, flat beyond the quoted strike range
+        x = np.clip(x, self.log_strikes[0], self.log_strikes[-1])
+        j = np.clip(np.searchsorted(self.log_strikes, x, side='right') - 1, 0, self.slopes.shape[1] - 1)
+        return self.w[rows, j] + (self.slopes[rows, j] * (x - self.log_strikes[j]))
+
+    def get_variance(self, strikes, days_to_maturity):
+        x, T = np.broadcast_arrays(np.log(np.asarray(strikes, dtype=float)), np.asarray(days_to_maturity, dtype=float) / 365)
+        shape = x.shape
+        x = x.ravel()
+        T = T.ravel()
+
+        if len(self.T) == 1:
+            return (self.row_variance(0, x) * T / self.T[0]).reshape(shape)
+
+        i = np.clip(np.searchsorted(self.T, T, side='right') - 1, 0, len(self.T) - 2)
+        w_lo = self.row_variance(i, x)
+        w_hi = self.row_variance(i + 1, x)
+
+        # Linear in T between expiries, constant vol before the first and after the last expiry
+        weight = (T - self.T[i]) / (self.T[i + 1] - self.T[i])
+        w = w_lo + (weight * (w_hi - w_lo))
+        w = np.where(T < self.T[0], w_lo * T / self.T[0], w)
+        w = np.where(T > self.T[-1], w_hi * T / self.T[-1], w)
+
+        return w.reshape(shape)
+
+    def get_vol(self, strikes, days_to_maturity):
+        T = np.asarray(days_to_maturity, dtype=float) / 365
+        return np.sqrt(self.get_variance(strikes, days_to_maturity) / T)
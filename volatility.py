@@ -0,0 +1,147 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+
+# Rolling mean over a trailing window in O(n) from cumulative sums, NaN until the window is full
+# Missing values are summed as zero and counted, so a window holding a NaN is NaN and later windows recover once it
+# has left (pandas rolling(window).mean())
+def rolling_mean(x, window):
+    x = np.asarray(x, dtype=float)
+    means = np.full(x.shape, np.nan)
+    if len(x) < window:
+        return means
+
+    valid = ~np.isnan(x)
+    sums = np.cumsum(np.insert(np.where(valid, x, 0), 0, 0))
+    counts = np.cumsum(np.insert(valid, 0, False))
+    window_counts = counts[window:] - counts[:-window]
+    means[window - 1:] = np.where(window_counts == window, (sums[window:] - sums[:-window]) / window, np.nan)
+    return means
+
+# Rolling sample variance (ddof=1) from cumulative sums of x and x ** 2
+def rolling_var(x, window):
+    mean = rolling_mean(x, window)
+    return (rolling_mean(x ** 2, window) - (mean ** 2)) * window / (window - 1)
+
+# Historical volatility estimators over a rolling window, annualized so any value can be passed as sigma to the pricers
+# Each calc_ method returns an array aligned with the input bars (NaN until enough bars are available)
+class Historical_Volatility:
+    def __init__(self, open_prices, high_prices, low_prices, close_prices, window=30, trading_days=252):
+        self.O = np.asarray(open_prices, dtype=float)
+        self.H = np.asarray(high_prices, dtype=float)
+        self.L = np.asarray(low_prices, dtype=float)
+        self.C = np.asarray(close_prices, dtype=float)
+        self.window = window
+        self.trading_days = trading_days
+
+        # Log returns are aligned to the bar they end on, the first bar has none
+        self.returns = np.insert(np.diff(np.log(self.C)), 0, np.nan)
+
+    def annualize(self, variance):
+        return np.sqrt(np.maximum(variance, 0) * self.trading_days)
+
+    def calc_close_to_close(self):
+        variance = np.insert(rolling_var(self.returns[1:], self.window), 0, np.nan)
+        return self.annualize(variance)
+
+    def calc_parkinson(self):
+        return self.annualize(rolling_mean(np.log(self.H / self.L) ** 2, self.window) / (4 * np.log(2)))
+
+    def calc_garman_klass(self):
+        terms = (0.5 * np.log(self.H / self.L) ** 2) - (((2 * np.log(2)) - 1) * np.log(self.C / self.O) ** 2)
+        return self.annualize(rolling_mean(terms, self.window))
+
+    def calc_rogers_satchell(self):
+        terms = (np.log(self.H / self.C) * np.log(self.H / self.O)) + (np.log(self.L / self.C) * np.log(self.L / self.O))
+        return self.annualize(rolling_mean(terms, self.window))
+
+    def calc_yang_zhang(self):
+        # Overnight (close to open), open to close and Rogers-Satchell variances combined with the minimum-variance weight k
+        overnight = np.log(self.O[1:] / self.C[:-1])
+        open_close = np.log(self.C[1:] / self.O[1:])
+        rs = (np.log(self.H / self.C) * np.log(self.H / self.O)) + (np.log(self.L / self.C) * np.log(self.L / self.O))
+
+        k = 0.34 / (1.34 + ((self.window + 1) / (self.window - 1)))
+        variance = rolling_var(overnight, self.window) + (k * rolling_var(open_close, self.window)) + ((1 - k) * rolling_mean(rs[1:], self.window))
+        return self.annualize(np.insert(variance, 0, np.nan))
+
+    def calc_ewma(self, lam=0.94):
+        # RiskMetrics recursion sigma2_t = lam * sigma2_{t-1} + (1 - lam) * r_t ** 2, seeded with the first squared return
+        # Missing returns are skipped: the recursion runs over the valid ones and the estimate is carried forward
+        r2 = self.returns[1:] ** 2
+        valid = ~np.isnan(r2)
+        if not valid.any():
+            return np.full(self.C.shape, np.nan)
+
+        filtered, _ = lfilter([1 - lam], [1, -lam], r2[valid], zi=[lam * r2[valid][0]])
+        last = np.cumsum(valid) - 1
+        variance = np.where(last >= 0, filtered[np.maximum(last, 0)], np.nan)
+        return self.annualize(np.insert(variance, 0, np.nan))
+
+# GARCH(1,1) fitted by Gaussian maximum likelihood on daily log returns
+# sigma2_t = omega + alpha * r_{t-1} ** 2 + beta * sigma2_{t-1}
+class Garch_Model:
+    def __init__(self, returns, trading_days=252):
+        self.returns = np.asarray(returns, dtype=float)
+        self.returns = self.returns[~np.isnan(self.returns)]
+        self.returns = self.returns - np.mean(self.returns)
+        self.trading_days = trading_days
+        self.omega = None
+        self.alpha = None
+        self.beta = None
+        self.variance = None
+
+        self.fit()
+
+    def filter_variance(self, omega, alpha, beta):
+        # The recursion is a constant-coefficient linear filter in sigma2, so lfilter runs it in C
+        r2 = self.returns ** 2
+        sample_var = np.mean(r2)
+        inputs = omega + (alpha * np.insert(r2[:-1], 0, sample_var))
+        variance, _ = lfilter([1], [1, -beta], inputs, zi=[beta * sample_var])
+        return variance
+
+    def neg_log_likelihood(self, params):
+        omega, alpha, beta = params
+        if omega <= 0 or alpha < 0 or beta < 0 or alpha + beta >= 1:
+            return np.inf
+
+        variance = self.filter_variance(omega, alpha, beta)
+        return 0.5 * np.sum(np.log(variance) + (self.returns ** 2 / variance))
+
+    def fit(self):
+        sample_var = np.var(self.returns)
+        start = [sample_var * 0.05, 0.05, 0.90]
+        result = minimize(self.neg_log_likelihood, start, method='Nelder-Mead', options={'xatol': 1e-10, 'fatol': 1e-10, 'maxiter': 5000})
+
+        self.omega, self.alpha, self.beta = result.x
+        self.variance = self.filter_variance(self.omega, self.alpha, self.beta)
+
+    def calc_long_run_vol(self):
+        return np.sqrt(self.omega / (1 - self.alpha - self.beta) * self.trading_days)
+
+    def forecast_variance(self, horizon):
+        # Daily variance forecasts for the next horizon days
+        persistence = self.alpha + self.beta
+        long_run = self.omega / (1 - persistence)
+        next_var = self.omega + (self.alpha * self.returns[-1] ** 2) + (self.beta * self.variance[-1])
+        return long_run + ((persistence ** np.arange(horizon)) * (next_var - long_run))
+
+    def forecast_vol(self, days_to_maturity):
+        # Annualized average volatility over the option's life, usable directly as the pricers' sigma
+        trading_horizon = max(int(round(days_to_maturity * self.trading_days / 365)), 1)
+        return np.sqrt(np.mean(self.forecast_variance(trading_horizon)) * self.trading_days)
+
+def fit_garch(returns):
+    return Garch_Model(returns)
+
+# Fits GARCH(1,1) for many tickers in parallel, returns {ticker: Garch_Model}
+# Workers are spawned rather than forked so this is safe to call from the multithreaded Streamlit server
+def fit_garch_many(returns_by_ticker, max_workers=None):
+    tickers = list(returns_by_ticker)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        models = executor.map(fit_garch, [returns_by_ticker[ticker] for ticker in tickers])
+        return dict(zip(tickers, models))